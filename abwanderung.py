@@ -0,0 +1,78 @@
+import numpy as np
+
+# Numba ist optional: ohne Numba werden die gleichwertigen NumPy-Varianten verwendet
+try:
+    from numba import njit
+    NUMBA_VERFUEGBAR = True
+except ImportError:
+    NUMBA_VERFUEGBAR = False
+
+def _abwanderung_anbieter_numpy(bew_sum, bew_count, rands, p_netz):
+    """
+    NumPy-Variante von abwanderung_anbieter (wird ohne Numba verwendet).
+    """
+    # Anbieter ohne Bewertungen erhalten die Bestnote und sind damit vom ersten Faktor ausgenommen
+    durchschnitt = np.where(bew_count > 0, bew_sum / np.maximum(bew_count, 1), 5.0)
+
+    # Je schlechter die Bewertungen, desto höher die Abwanderungswahrscheinlichkeit
+    p_bewertung = np.clip(0.1 + (2.5 - durchschnitt) * 0.2, 0, 0.9) * (durchschnitt <= 2.5)
+
+    # Wahrscheinlichkeit, dass mindestens einer der beiden Faktoren zur Abwanderung führt
+    return rands < 1 - (1 - p_bewertung) * (1 - p_netz)
+
+def _abwanderung_nachfrager_numpy(rands, p_netz):
+    """
+    NumPy-Variante von abwanderung_nachfrager (wird ohne Numba verwendet).
+    """
+    return rands < p_netz
+
+if NUMBA_VERFUEGBAR:
+    @njit(fastmath=True, cache=True)
+    def abwanderung_anbieter(bew_sum, bew_count, rands, p_netz):
+        """
+        Bestimmt für alle Anbieter, ob sie die Plattform verlassen.
+
+        Die Entscheidung basiert auf zwei Faktoren:
+        1. Die durchschnittliche Bewertung (ab einem Durchschnitt von 2.5 oder schlechter)
+        2. Der Rückgang der Netzwerkeffekte (p_netz, für alle Anbieter gleich)
+
+        Args:
+            bew_sum (numpy.ndarray): Summe der Bewertungen je Anbieter
+            bew_count (numpy.ndarray): Anzahl der Bewertungen je Anbieter
+            rands (numpy.ndarray): Eine gleichverteilte Zufallszahl je Anbieter
+            p_netz (float): Abwanderungswahrscheinlichkeit durch sinkende Netzwerkeffekte
+
+        Returns:
+            numpy.ndarray: Boolesche Maske der abwandernden Anbieter
+        """
+        n = bew_sum.shape[0]
+        abwandernd = np.empty(n, dtype=np.bool_)
+        for i in range(n):
+            p_bewertung = 0.0
+            if bew_count[i] > 0:
+                durchschnitt = bew_sum[i] / bew_count[i]
+                if durchschnitt <= 2.5:
+                    p_bewertung = min(0.1 + (2.5 - durchschnitt) * 0.2, 0.9)
+            abwandernd[i] = rands[i] < 1.0 - (1.0 - p_bewertung) * (1.0 - p_netz)
+        return abwandernd
+
+    @njit(fastmath=True, cache=True)
+    def abwanderung_nachfrager(rands, p_netz):
+        """
+        Bestimmt für alle Nachfrager, ob sie die Plattform verlassen würden.
+
+        Args:
+            rands (numpy.ndarray): Eine gleichverteilte Zufallszahl je Nachfrager
+            p_netz (float): Abwanderungswahrscheinlichkeit durch sinkende Netzwerkeffekte
+
+        Returns:
+            numpy.ndarray: Boolesche Maske der abwandernden Nachfrager
+        """
+        n = rands.shape[0]
+        abwandernd = np.empty(n, dtype=np.bool_)
+        for i in range(n):
+            abwandernd[i] = rands[i] < p_netz
+        return abwandernd
+else:
+    abwanderung_anbieter = _abwanderung_anbieter_numpy
+    abwanderung_nachfrager = _abwanderung_nachfrager_numpy
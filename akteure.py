@@ -1,17 +1,33 @@
 import random
 
+# Gewichte für die Wahrscheinlichkeiten der verschiedenen Bewertungen
+# [5%, 10%, 30%, 30%, 25%] für [1, 2, 3, 4, 5] Sterne
+BEWERTUNGEN = [1, 2, 3, 4, 5]
+BEWERTUNGS_GEWICHTE = [0.05, 0.1, 0.3, 0.3, 0.25]
+
+# Anzahl der Bewertungen, die auf einmal im Voraus gezogen werden
+BEWERTUNGS_POOL_GROESSE = 8192
+
+# Ganzzahlige Typkennungen der Akteure (Attribut kind)
+ANBIETER = 0
+NACHFRAGER = 1
+
 class Anbieter:
     """
     Repräsentiert einen Anbieter auf der Plattform.
     
     Ein Anbieter stellt Produkte oder Dienstleistungen auf der Plattform zur Verfügung
-    und kann basierend auf erhaltenen Bewertungen und dem Zustand der Netzwerkeffekte
-    entscheiden, ob er auf der Plattform bleibt oder abwandert.
+    und sammelt Bewertungen der Nachfrager. Ob er auf der Plattform bleibt oder
+    abwandert, entscheidet das Modell einmal pro Schritt für alle Anbieter gemeinsam
+    (siehe PlattformModel.pruefe_abwanderung_anbieter).
     
     Attributes:
         unique_id (int): Eindeutige ID des Anbieters
         model (PlattformModel): Referenz zum übergeordneten Modell
-        bewertungen (list): Liste mit erhaltenen Bewertungen (1-5 Sterne)
+        bew_sum (int): Summe aller erhaltenen Bewertungen (1-5 Sterne)
+        bew_count (int): Anzahl der erhaltenen Bewertungen
+        kind (int): Typkennung ANBIETER
+        _idx (int): Position in der Anbieterliste des Modells
     """
     
     def __init__(self, unique_id, model):
@@ -24,56 +40,23 @@ class Anbieter:
         """
         self.unique_id = unique_id
         self.model = model
-        self.bewertungen = []
-
-    def step(self):
-        """
-        Führt einen Simulationsschritt für den Anbieter durch.
-        
-        In jedem Schritt prüft der Anbieter, ob er die Plattform verlassen will,
-        basierend auf seinen erhaltenen Bewertungen und dem Zustand der Plattform.
-        """
-        if self.pruefe_abwanderung():
-            self.model.abgewanderte_anbieter += 1  # Anbieter-Abwanderung zählt hoch
-            self.model.schedule.remove(self)  # Anbieter wird entfernt
+        self.bew_sum = 0
+        self.bew_count = 0
+        self.kind = ANBIETER
+        self._idx = None  # Wird vom Modell beim Hinzufügen gesetzt
 
     def erhalte_bewertung(self, bewertung):
         """
-        Nimmt eine Bewertung von einem Nachfrager entgegen und speichert sie.
+        Nimmt eine Bewertung von einem Nachfrager entgegen.
+        
+        Es werden nur Summe und Anzahl geführt, da für die Abwanderung
+        lediglich die Durchschnittsbewertung benötigt wird.
         
         Args:
             bewertung (int): Bewertung des Anbieters (1-5 Sterne)
         """
-        self.bewertungen.append(bewertung)
-
-    def pruefe_abwanderung(self):
-        """
-        Prüft, ob der Anbieter die Plattform verlassen soll.
-        
-        Die Entscheidung basiert auf zwei Faktoren:
-        1. Die durchschnittliche Bewertung (schlechte Bewertungen erhöhen die Abwanderungswahrscheinlichkeit)
-        2. Der Zustand der Netzwerkeffekte (sinkende Netzwerkeffekte erhöhen die Abwanderungswahrscheinlichkeit)
-        
-        Returns:
-            bool: True, wenn der Anbieter abwandern soll, sonst False
-        """
-        # Abwanderungslogik basierend auf Bewertungen
-        if len(self.bewertungen) > 0:
-            durchschnitt = sum(self.bewertungen) / len(self.bewertungen)
-            if durchschnitt <= 2.5:
-                # Je schlechter die Bewertungen, desto höher die Abwanderungswahrscheinlichkeit
-                abwanderungswahrscheinlichkeit = min(0.1 + (2.5 - durchschnitt) * 0.2, 0.9)
-                if random.random() < abwanderungswahrscheinlichkeit:
-                    return True
-
-        # Abwanderungslogik basierend auf Netzwerkeffekten
-        if self.model.sinkt_netzwerkeffekt():
-            # Stärkerer Rückgang der Netzwerkeffekte führt zu höherer Abwanderungswahrscheinlichkeit
-            abwanderungswahrscheinlichkeit = max(0.05, min(0.2, abs(self.model.N_p_history[-1] - self.model.N_p_history[0]) / 1000))
-            if random.random() < abwanderungswahrscheinlichkeit:
-                return True
-
-        return False
+        self.bew_sum += bewertung
+        self.bew_count += 1
 
 
 class Nachfrager:
@@ -87,6 +70,8 @@ class Nachfrager:
         unique_id (int): Eindeutige ID des Nachfragers
         model (PlattformModel): Referenz zum übergeordneten Modell
         cooldown (int): Sperrzeit zwischen Käufen in Tagen
+        kind (int): Typkennung NACHFRAGER
+        _idx (int): Position in der Nachfragerliste des Modells
     """
     
     def __init__(self, unique_id, model):
@@ -100,6 +85,8 @@ class Nachfrager:
         self.unique_id = unique_id
         self.model = model
         self.cooldown = 0  # Sperrzeit zwischen Käufen
+        self.kind = NACHFRAGER
+        self._idx = None  # Wird vom Modell beim Hinzufügen gesetzt
 
     def step(self):
         """
@@ -129,12 +116,11 @@ class Nachfrager:
                 self.cooldown = 7  # 7 Tage Cooldown nach einem Kauf (außer an Angebotstagen)
 
         # Prüfen, ob der Nachfrager abwandern soll
-        if self.model.sinkt_netzwerkeffekt():
-            # Abwanderungswahrscheinlichkeit basierend auf der Stärke des Netzwerkeffektrückgangs
-            abwanderungswahrscheinlichkeit = max(0.02, min(0.15, abs(self.model.N_p_history[-1] - self.model.N_p_history[0]) / 1500))
-            if random.random() < abwanderungswahrscheinlichkeit:
-                self.model.abgewanderte_nachfrager += 1
-                self.model.schedule.remove(self)  # Nachfrager wird entfernt
+        # Die Entscheidung basiert auf der Stärke des Netzwerkeffektrückgangs und wird
+        # einmal pro Schritt für alle Nachfrager im Modell bestimmt
+        if self.model._abwandernd_nf[self._idx]:
+            # Nachfrager wird vorgemerkt und nach der Aktivierung aller Nachfrager entfernt
+            self.model._abgewanderte_nf.append(self)
 
     def kaufen(self):
         """
@@ -142,7 +128,7 @@ class Nachfrager:
         
         Der Nachfrager wählt zufällig einen Anbieter aus und bewertet ihn.
         """
-        anbieter_liste = [a for a in self.model.schedule.agents if isinstance(a, Anbieter)]
+        anbieter_liste = self.model.anbieter_list
         if anbieter_liste:
             anbieter = random.choice(anbieter_liste)
             bewertung = self.bewerten()
@@ -154,11 +140,18 @@ class Nachfrager:
         
         Die Verteilung der Bewertungen ist leicht nach oben verschoben,
         mit höherer Wahrscheinlichkeit für 3-5 Sterne als für 1-2 Sterne.
+        Die Bewertungen werden blockweise im Voraus gezogen und aus einem
+        gemeinsamen Vorrat des Modells entnommen.
         
         Returns:
             int: Bewertung zwischen 1 und 5 Sternen
         """
-        # Gewichte für die Wahrscheinlichkeiten der verschiedenen Bewertungen
-        # [5%, 10%, 30%, 30%, 25%] für [1, 2, 3, 4, 5] Sterne
-        gewichte = [0.05, 0.1, 0.3, 0.3, 0.25]
-        return random.choices([1, 2, 3, 4, 5], weights=gewichte, k=1)[0]
\ No newline at end of file
+        model = self.model
+        if model._rating_idx >= len(model._rating_pool):
+            model._rating_pool = model.rng.choice(
+                BEWERTUNGEN, size=BEWERTUNGS_POOL_GROESSE, p=BEWERTUNGS_GEWICHTE
+            ).tolist()
+            model._rating_idx = 0
+        bewertung = model._rating_pool[model._rating_idx]
+        model._rating_idx += 1
+        return bewertung
\ No newline at end of file
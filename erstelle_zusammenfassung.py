@@ -1,8 +1,10 @@
 import os
+import multiprocessing as mp
 import pandas as pd
 import numpy as np
-import glob
-from pathlib import Path
+from speicherung import (
+    speichere_rohdaten, lade_rohdaten, finde_rohdaten, finde_iterationsverzeichnisse, ROHDATEN_ENDUNGEN
+)
 
 def erstelle_gesamtzusammenfassung(basis_verzeichnis):
     """
@@ -21,69 +23,62 @@ def erstelle_gesamtzusammenfassung(basis_verzeichnis):
         for item in os.listdir(basis_verzeichnis):
             print(f"  - {item}")
     
-    # Suche direkt nach Iterationsordnern
-    iteration_dirs = sorted(glob.glob(os.path.join(basis_verzeichnis, "iteration_*")))
+    # Suche direkt nach Iterationsordnern (des neuesten Durchlaufs)
+    iteration_dirs = finde_iterationsverzeichnisse(basis_verzeichnis)
     hauptlauf_verzeichnis = basis_verzeichnis
     
     if not iteration_dirs:
         print(f"Keine Iterationsverzeichnisse gefunden in {basis_verzeichnis}")
         return None
     
-    # Listen zum Sammeln aller Ergebnisse
-    alle_einzelmassnahmen = []
-    alle_cluster = []
-    alle_kombinationen = []
-    alle_gesamtvergleiche = []
+    # Listen zum Sammeln der gefundenen Dateien als (Iterationsnummer, Pfad)
+    pfade = {
+        "einzelmassnahmen": [],
+        "cluster": [],
+        "kombinationen": [],
+        "gesamtvergleich": []
+    }
     
     # Durchlaufe alle gefundenen Iterationsverzeichnisse
-    for iteration_dir in iteration_dirs:
-        iteration_nummer = int(Path(iteration_dir).name.split('_')[1])
+    for iteration_nummer, iteration_dir in iteration_dirs:
         print(f"Verarbeite Iteration {iteration_nummer} aus {iteration_dir}")
         
-        # Suche nach den Zusammenfassungsdateien
-        einzelmassnahmen_path = os.path.join(iteration_dir, "zusammenfassung_einzelmassnahmen.csv")
-        cluster_path = os.path.join(iteration_dir, "zusammenfassung_cluster.csv")
-        kombinationen_path = os.path.join(iteration_dir, "zusammenfassung_clusterkombinationen.csv")
+        # Verzeichnisinhalt einmal auslesen statt jede Datei einzeln zu prüfen
+        with os.scandir(iteration_dir) as it:
+            eintraege = {e.name for e in it}
         
         # Suche nach dem Gesamtvergleich (kann einen Zeitstempel im Namen haben)
-        gesamtvergleiche = glob.glob(os.path.join(iteration_dir, "gesamtvergleich_aller_simulationen_*.csv"))
-        gesamtvergleich_path = gesamtvergleiche[0] if gesamtvergleiche else None
-        
-        # Lade die Daten, wenn die Dateien existieren
-        if os.path.exists(einzelmassnahmen_path):
-            df = pd.read_csv(einzelmassnahmen_path)
-            df['Iteration'] = iteration_nummer
-            # Kategoriespalte hinzufügen, falls nicht vorhanden
-            if 'Kategorie' not in df.columns:
-                df['Kategorie'] = 'Einzelmaßnahme'
-            alle_einzelmassnahmen.append(df)
+        gesamtvergleich_name = next(
+            (n for n in sorted(eintraege)
+             if n.startswith("gesamtvergleich_aller_simulationen_") and n.endswith(ROHDATEN_ENDUNGEN)),
+            None
+        )
+        
+        # Merke die Dateien vor, wenn sie existieren (als Parquet- oder CSV-Datei)
+        einzelmassnahmen_name = finde_rohdaten(eintraege, "zusammenfassung_einzelmassnahmen")
+        if einzelmassnahmen_name:
+            pfade["einzelmassnahmen"].append(
+                (iteration_nummer, os.path.join(iteration_dir, einzelmassnahmen_name)))
         else:
             print(f"Warnung: Keine Einzelmaßnahmen-Zusammenfassung gefunden in Iteration {iteration_nummer}")
         
-        if os.path.exists(cluster_path):
-            df = pd.read_csv(cluster_path)
-            df['Iteration'] = iteration_nummer
-            # Kategoriespalte hinzufügen, falls nicht vorhanden
-            if 'Kategorie' not in df.columns:
-                df['Kategorie'] = 'Cluster'
-            alle_cluster.append(df)
+        cluster_name = finde_rohdaten(eintraege, "zusammenfassung_cluster")
+        if cluster_name:
+            pfade["cluster"].append(
+                (iteration_nummer, os.path.join(iteration_dir, cluster_name)))
         else:
             print(f"Warnung: Keine Cluster-Zusammenfassung gefunden in Iteration {iteration_nummer}")
         
-        if os.path.exists(kombinationen_path):
-            df = pd.read_csv(kombinationen_path)
-            df['Iteration'] = iteration_nummer
-            # Kategoriespalte hinzufügen, falls nicht vorhanden
-            if 'Kategorie' not in df.columns:
-                df['Kategorie'] = 'Kombination'
-            alle_kombinationen.append(df)
+        kombinationen_name = finde_rohdaten(eintraege, "zusammenfassung_clusterkombinationen")
+        if kombinationen_name:
+            pfade["kombinationen"].append(
+                (iteration_nummer, os.path.join(iteration_dir, kombinationen_name)))
         else:
             print(f"Warnung: Keine Kombinationen-Zusammenfassung gefunden in Iteration {iteration_nummer}")
         
-        if gesamtvergleich_path and os.path.exists(gesamtvergleich_path):
-            df = pd.read_csv(gesamtvergleich_path)
-            df['Iteration'] = iteration_nummer
-            alle_gesamtvergleiche.append(df)
+        if gesamtvergleich_name:
+            pfade["gesamtvergleich"].append(
+                (iteration_nummer, os.path.join(iteration_dir, gesamtvergleich_name)))
         else:
             print(f"Warnung: Kein Gesamtvergleich gefunden in Iteration {iteration_nummer}")
     
@@ -91,25 +86,42 @@ def erstelle_gesamtzusammenfassung(basis_verzeichnis):
     ausgabe_verzeichnis = os.path.join(basis_verzeichnis, "zusammenfassung")
     os.makedirs(ausgabe_verzeichnis, exist_ok=True)
     
-    # Zusammenführen aller Daten
-    ergebnisse = {}
-    
-    if alle_einzelmassnahmen:
-        ergebnisse["einzelmassnahmen"] = pd.concat(alle_einzelmassnahmen, ignore_index=True)
-    
-    if alle_cluster:
-        ergebnisse["cluster"] = pd.concat(alle_cluster, ignore_index=True)
+    # Kategorie, die ergänzt wird, falls die Dateien keine eigene Kategoriespalte haben
+    kategorien = {
+        "einzelmassnahmen": "Einzelmaßnahme",
+        "cluster": "Cluster",
+        "kombinationen": "Kombination"
+    }
     
-    if alle_kombinationen:
-        ergebnisse["kombinationen"] = pd.concat(alle_kombinationen, ignore_index=True)
+    # Alle Dateien parallel einlesen, da das Parsen der Dateien voneinander unabhängig ist
+    alle_pfade = [pfad for eintraege in pfade.values() for _, pfad in eintraege]
+    with mp.Pool(max(1, min(mp.cpu_count(), len(alle_pfade)))) as pool:
+        geladen = dict(zip(alle_pfade, pool.map(lade_rohdaten, alle_pfade)))
     
-    if alle_gesamtvergleiche:
-        ergebnisse["gesamtvergleich"] = pd.concat(alle_gesamtvergleiche, ignore_index=True)
+    # Zusammenführen aller Daten: ein concat je Kategorie, die Iterationsspalte ergibt sich aus den Keys
+    ergebnisse = {}
+    for name, eintraege in pfade.items():
+        if not eintraege:
+            continue
+        
+        df = pd.concat(
+            [geladen[pfad] for _, pfad in eintraege],
+            keys=[iteration_nummer for iteration_nummer, _ in eintraege],
+            names=["Iteration", None]
+        ).reset_index(level=0).reset_index(drop=True)
+        df["Iteration"] = df.pop("Iteration")
+        
+        if name in kategorien and "Kategorie" not in df.columns:
+            df = df.assign(Kategorie=kategorien[name])
+        
+        ergebnisse[name] = df
     
     # Erstelle Zusammenfassungen und speichere sie
     for name, df in ergebnisse.items():
-        # Speichere die kombinierten Rohdaten
-        df.to_csv(os.path.join(ausgabe_verzeichnis, f"alle_{name}.csv"), index=False)
+        # Speichere die kombinierten Rohdaten (der Gesamtvergleich wird unten als
+        # "alle_ergebnisse_aller_durchlaufe" gespeichert und hier nicht doppelt geschrieben)
+        if name != "gesamtvergleich":
+            speichere_rohdaten(df, os.path.join(ausgabe_verzeichnis, f"alle_{name}"))
         
         # Gruppieren nach Strategie und berechne Statistiken
         if "Strategie" in df.columns and "Netzwerkeffekte" in df.columns:
@@ -169,7 +181,7 @@ def erstelle_gesamtzusammenfassung(basis_verzeichnis):
         gesamt_zusammenfassung.to_csv(os.path.join(ausgabe_verzeichnis, "gesamtzusammenfassung_aller_durchlaufe.csv"))
         
         # Speichere auch die Detailergebnisse
-        gesamtvergleich_df.to_csv(os.path.join(ausgabe_verzeichnis, "alle_ergebnisse_aller_durchlaufe.csv"), index=False)
+        speichere_rohdaten(gesamtvergleich_df, os.path.join(ausgabe_verzeichnis, "alle_ergebnisse_aller_durchlaufe"))
         
         print("\n" + "="*80)
         print("=== GESAMTZUSAMMENFASSUNG ÜBER ALLE DURCHLÄUFE ===")
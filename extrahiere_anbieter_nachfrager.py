@@ -1,117 +1,264 @@
 import os
+import io
+import multiprocessing as mp
 import pandas as pd
 import numpy as np
-import glob
-from pathlib import Path
+from speicherung import lade_rohdaten, finde_iterationsverzeichnisse, ROHDATEN_ENDUNGEN
+
+# Numba ist optional: ohne Numba läuft die Aktualisierung als normale Python-Funktion
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda funktion: funktion
+
+# Spalten, die aus den Simulationsdateien benötigt werden
+END_SPALTEN = ('Anbieter', 'Nachfrager', 'Netzwerkeffekte')
+
+# Strategienamen der Einzelmaßnahmen und Cluster zur Bestimmung der Kategorie
+_EINZEL = frozenset({
+    "SEM", "Social Media Marketing", "Affiliate Marketing",
+    "Reduzierte Gebühren", "Freemium Modell", "Eigenes Forum",
+    "Treuepunkte", "Personalisierte Empfehlungen", "Nachhaltige Werte",
+    "CO2 Transparenz", "Nachhaltige Produktfilter", "Regionale Kooperationen"
+})
+_CLUSTER = frozenset({
+    "Sichtbarkeit & Nutzergewinnung", "Monetarisierung",
+    "Community & Nutzerbindung", "Nachhaltigkeit & Lokalität"
+})
+
+# Spalten des Akkumulators je Kennzahl: Anzahl, Mittelwert, M2 (Summe der quadrierten Abweichungen), Min, Max
+_N, _MEAN, _M2, _MIN, _MAX = range(5)
+
+def neuer_akkumulator():
+    """
+    Erstellt einen leeren Akkumulator für die laufende Statistik einer Strategie.
+    
+    Returns:
+        numpy.ndarray: Array der Form (Anzahl Kennzahlen, 5)
+    """
+    zustand = np.zeros((len(END_SPALTEN), 5))
+    zustand[:, _MIN] = np.inf
+    zustand[:, _MAX] = -np.inf
+    return zustand
+
+@njit(cache=True)
+def aktualisiere_akkumulator(zustand, werte):
+    """
+    Nimmt die Endwerte eines Laufs nach Welford in die laufende Statistik auf.
+    
+    Args:
+        zustand (numpy.ndarray): Akkumulator aus neuer_akkumulator (wird verändert)
+        werte (numpy.ndarray): Ein Wert je Kennzahl
+    """
+    for j in range(werte.shape[0]):
+        n = zustand[j, _N] + 1
+        delta = werte[j] - zustand[j, _MEAN]
+        mittelwert = zustand[j, _MEAN] + delta / n
+        zustand[j, _M2] += delta * (werte[j] - mittelwert)
+        zustand[j, _MEAN] = mittelwert
+        zustand[j, _N] = n
+        zustand[j, _MIN] = min(zustand[j, _MIN], werte[j])
+        zustand[j, _MAX] = max(zustand[j, _MAX], werte[j])
+
+def verrechne(akkumulatoren, strategie, kategorie, werte):
+    """
+    Nimmt die Endwerte eines Laufs in den Akkumulator seiner Strategie auf.
+    
+    Args:
+        akkumulatoren (dict): Strategie -> (Kategorie, Akkumulator) (wird verändert)
+        strategie (str): Name der Strategie
+        kategorie (str): Kategorie der Strategie
+        werte (array-like): Ein Wert je Kennzahl
+    """
+    if strategie not in akkumulatoren:
+        akkumulatoren[strategie] = (kategorie, neuer_akkumulator())
+    aktualisiere_akkumulator(akkumulatoren[strategie][1], np.asarray(werte, dtype=np.float64))
+
+def lies_letzte_zeile(pfad, spalten=END_SPALTEN, blockgroesse=4096):
+    """
+    Liest nur die Kopfzeile und die letzte Datenzeile einer Simulationsdatei.
+    
+    Bei CSV-Dateien wird statt die gesamte Zeitreihe zu parsen ans Dateiende gesprungen
+    und nur der letzte Block gelesen, in dem die letzte Zeile vollständig enthalten ist.
+    Bei Parquet-Dateien werden nur die angeforderten Spalten gelesen.
+    
+    Args:
+        pfad (str): Pfad zur CSV- oder Parquet-Datei
+        spalten (tuple): Namen der Spalten, die eingelesen werden sollen
+        blockgroesse (int): Anzahl der Bytes, die vom Dateiende gelesen werden
+    
+    Returns:
+        pandas.Series: Die letzte Zeile mit den vorhandenen angeforderten Spalten
+    """
+    if pfad.endswith('.parquet'):
+        df = lade_rohdaten(pfad, spalten=list(spalten))
+        if df.empty:
+            raise ValueError("Datei enthält keine Datenzeilen")
+        return df.iloc[-1]
+    
+    with open(pfad, 'rb') as f:
+        kopfzeile = f.readline()
+        f.seek(0, os.SEEK_END)
+        groesse = f.tell()
+        f.seek(max(len(kopfzeile), groesse - blockgroesse))
+        zeilen = f.read().rstrip().splitlines()
+    
+    if not zeilen:
+        raise ValueError("Datei enthält keine Datenzeilen")
+    
+    df = pd.read_csv(io.BytesIO(kopfzeile + zeilen[-1]), usecols=lambda spalte: spalte in spalten)
+    return df.iloc[0]
+
+def bestimme_strategie(strategie_teile):
+    """
+    Bestimmt Strategie und Kategorie aus dem Strategieteil eines Dateinamens.
+    
+    Args:
+        strategie_teile (str): Dateiname ohne Präfix, Laufnummer und Endung
+    
+    Returns:
+        tuple: (Strategie, Kategorie)
+    """
+    # Normalisiere den Strategienamen (ersetze Unterstriche durch Leerzeichen und Kommas)
+    strategie = strategie_teile.replace('_und_', ' & ').replace('_', ' ')
+    
+    # Bestimme die Kategorie (Einzelmaßnahme, Cluster, Kombination)
+    kategorie = ("Einzelmaßnahme" if strategie in _EINZEL
+                 else "Cluster" if strategie in _CLUSTER
+                 else "Kombination")
+    return strategie, kategorie
+
+def lade_detailwerte(detail_file):
+    """
+    Liest die Endwerte aller Läufe einer Konfiguration aus ihrer Detaildatei.
+    
+    Wird verwendet, wenn die Simulationen ohne Zeitreihen durchgeführt wurden und
+    daher keine Simulationsdateien vorliegen.
+    
+    Args:
+        detail_file (str): Pfad zur Datei ergebnisse_detail_*
+    
+    Returns:
+        tuple: (Strategie, Kategorie, Array mit einer Zeile je Lauf) oder
+            None, falls die Datei nicht verarbeitet werden konnte
+    """
+    strategie_teile = os.path.splitext(os.path.basename(detail_file))[0].split('ergebnisse_detail_', 1)[1]
+    strategie, kategorie = bestimme_strategie(strategie_teile)
+    
+    try:
+        werte = lade_rohdaten(detail_file, spalten=list(END_SPALTEN)).to_numpy(dtype=np.float64)
+    except Exception as e:
+        print(f"Fehler beim Verarbeiten von {detail_file}: {str(e)}")
+        return None
+    
+    return strategie, kategorie, werte
+
+def lade_letzte_werte(sim_file):
+    """
+    Liest eine Simulationsdatei und bestimmt Strategie, Kategorie und Endwerte.
+    
+    Wird in einem Prozesspool ausgeführt, daher werden nur die drei benötigten
+    Endwerte statt des gesamten DataFrames zurückgegeben.
+    
+    Args:
+        sim_file (str): Pfad zur Simulationsdatei
+    
+    Returns:
+        tuple: (Strategie, Kategorie, (Anbieter, Nachfrager, Netzwerkeffekte)) oder
+            None, falls die Datei nicht verarbeitet werden konnte
+    """
+    # Extrahiere den Strategienamen aus dem Dateinamen
+    file_name = os.path.basename(sim_file)
+    strategie_teile = file_name.split('_run')[0].split('simulation_')[1]
+    strategie, kategorie = bestimme_strategie(strategie_teile)
+    
+    # Lese die letzte Zeile der Simulationsdatei
+    try:
+        # Extrahiere die letzten Werte für Anbieter und Nachfrager
+        letzte_werte = lies_letzte_zeile(sim_file)
+        anbieter = letzte_werte.get('Anbieter', 0)
+        nachfrager = letzte_werte.get('Nachfrager', 0)
+        netzwerkeffekte = letzte_werte.get('Netzwerkeffekte', 0)
+    except Exception as e:
+        print(f"Fehler beim Verarbeiten von {sim_file}: {str(e)}")
+        return None
+    
+    return strategie, kategorie, (anbieter, nachfrager, netzwerkeffekte)
 
 def extrahiere_anbieter_nachfrager_daten(basis_verzeichnis):
     """
     Extrahiert die Anbieter- und Nachfragerdaten aus allen Simulationsdateien
     mit statistischen Kennwerten.
     
+    Wurden die Simulationen ohne Zeitreihen durchgeführt, werden die Endwerte
+    stattdessen aus den Detaildateien (ergebnisse_detail_*) gelesen.
+    
     Args:
         basis_verzeichnis (str): Pfad zum Hauptverzeichnis der Simulationsläufe
     """
     print(f"Suche in: {basis_verzeichnis}")
     
-    # Suche nach allen Iterationsverzeichnissen
-    iteration_dirs = sorted(glob.glob(os.path.join(basis_verzeichnis, "iteration_*")))
+    # Suche nach allen Iterationsverzeichnissen (des neuesten Durchlaufs)
+    iteration_dirs = finde_iterationsverzeichnisse(basis_verzeichnis)
     
     if not iteration_dirs:
         print(f"Keine Iterationsverzeichnisse gefunden in {basis_verzeichnis}")
         return None
     
-    # Dictionary zur Speicherung der Ergebnisse
-    strategie_daten = {}
-    
-    # Durchlaufe alle Iterationsverzeichnisse
-    for iteration_dir in iteration_dirs:
-        iteration_nummer = int(Path(iteration_dir).name.split('_')[1])
+    # Suche nach allen Dateien (Parquet oder CSV), die Simulationsergebnisse bzw. Detailergebnisse enthalten
+    simulation_files = []
+    detail_files = []
+    for iteration_nummer, iteration_dir in iteration_dirs:
         print(f"Verarbeite Iteration {iteration_nummer} aus {iteration_dir}")
-        
-        # Suche nach allen CSV-Dateien, die Simulationsergebnisse enthalten
-        simulation_files = glob.glob(os.path.join(iteration_dir, "simulation_*.csv"))
-        
-        for sim_file in simulation_files:
-            # Extrahiere den Strategienamen aus dem Dateinamen
-            file_name = os.path.basename(sim_file)
-            strategie_teile = file_name.split('_run')[0].split('simulation_')[1]
-            
-            # Normalisiere den Strategienamen (ersetze Unterstriche durch Leerzeichen und Kommas)
-            strategie = strategie_teile.replace('_und_', ' & ').replace('_', ' ')
-            
-            # Bestimme die Kategorie (Einzelmaßnahme, Cluster, Kombination)
-            if strategie in ["SEM", "Social Media Marketing", "Affiliate Marketing", 
-                           "Reduzierte Gebühren", "Freemium Modell", "Eigenes Forum", 
-                           "Treuepunkte", "Personalisierte Empfehlungen", "Nachhaltige Werte", 
-                           "CO2 Transparenz", "Nachhaltige Produktfilter", "Regionale Kooperationen"]:
-                kategorie = "Einzelmaßnahme"
-            elif strategie in ["Sichtbarkeit & Nutzergewinnung", "Monetarisierung", 
-                             "Community & Nutzerbindung", "Nachhaltigkeit & Lokalität"]:
-                kategorie = "Cluster"
-            else:
-                kategorie = "Kombination"
-            
-            # Lese die CSV-Datei
-            try:
-                df = pd.read_csv(sim_file)
-                
-                # Extrahiere die letzten Werte für Anbieter und Nachfrager
-                letzte_werte = df.iloc[-1]
-                anbieter = letzte_werte.get('Anbieter', 0)
-                nachfrager = letzte_werte.get('Nachfrager', 0)
-                netzwerkeffekte = letzte_werte.get('Netzwerkeffekte', 0)
-                
-                # Speichere die Werte im Dictionary
-                if strategie not in strategie_daten:
-                    strategie_daten[strategie] = {
-                        'Kategorie': kategorie,
-                        'Anbieter': [],
-                        'Nachfrager': [],
-                        'Netzwerkeffekte': []
-                    }
-                
-                strategie_daten[strategie]['Anbieter'].append(anbieter)
-                strategie_daten[strategie]['Nachfrager'].append(nachfrager)
-                strategie_daten[strategie]['Netzwerkeffekte'].append(netzwerkeffekte)
-                
-            except Exception as e:
-                print(f"Fehler beim Verarbeiten von {sim_file}: {str(e)}")
-    
-    # Berechne Mittelwerte, Standardabweichungen, Min und Max und erstelle Ergebnistabelle
+        with os.scandir(iteration_dir) as it:
+            for e in it:
+                if e.name.endswith(ROHDATEN_ENDUNGEN):
+                    if e.name.startswith("simulation_"):
+                        simulation_files.append(e.path)
+                    elif e.name.startswith("ergebnisse_detail_"):
+                        detail_files.append(e.path)
+    
+    if not simulation_files and not detail_files:
+        print(f"Keine Simulations- oder Detaildateien gefunden in {basis_verzeichnis}")
+        return None
+    
+    # Laufende Statistik (Welford) je Strategie, es werden keine Einzelwerte gespeichert
+    akkumulatoren = {}
+    
+    if simulation_files:
+        # Die Dateien sind unabhängig voneinander und werden parallel eingelesen,
+        # die Ergebnisse werden direkt beim Eintreffen verrechnet
+        with mp.Pool(max(1, min(mp.cpu_count(), len(simulation_files)))) as pool:
+            for resultat in pool.imap(lade_letzte_werte, simulation_files, chunksize=16):
+                if resultat is not None:
+                    verrechne(akkumulatoren, *resultat)
+    else:
+        # Ohne Zeitreihen stehen die Endwerte jedes Laufs als Zeile in den Detaildateien
+        print("Keine Simulationsdateien gefunden, verwende die Endwerte aus den Detaildateien")
+        for detail_file in detail_files:
+            resultat = lade_detailwerte(detail_file)
+            if resultat is None:
+                continue
+            strategie, kategorie, werte = resultat
+            for zeile in werte:
+                verrechne(akkumulatoren, strategie, kategorie, zeile)
+    
+    if not akkumulatoren:
+        print(f"Keine auswertbaren Ergebnisse gefunden in {basis_verzeichnis}")
+        return None
+    
+    # Berechne Mittelwerte, Standardabweichungen, Min und Max aus den Akkumulatoren
+    # (Standardabweichung wie np.std als Populationsstandardabweichung, ddof=0)
     ergebnis_daten = []
-    for strategie, daten in strategie_daten.items():
-        anbieter_mean = sum(daten['Anbieter']) / len(daten['Anbieter']) if daten['Anbieter'] else 0
-        anbieter_std = np.std(daten['Anbieter']) if daten['Anbieter'] else 0
-        anbieter_min = min(daten['Anbieter']) if daten['Anbieter'] else 0
-        anbieter_max = max(daten['Anbieter']) if daten['Anbieter'] else 0
-        
-        nachfrager_mean = sum(daten['Nachfrager']) / len(daten['Nachfrager']) if daten['Nachfrager'] else 0
-        nachfrager_std = np.std(daten['Nachfrager']) if daten['Nachfrager'] else 0
-        nachfrager_min = min(daten['Nachfrager']) if daten['Nachfrager'] else 0
-        nachfrager_max = max(daten['Nachfrager']) if daten['Nachfrager'] else 0
-        
-        netzwerkeffekte_mean = sum(daten['Netzwerkeffekte']) / len(daten['Netzwerkeffekte']) if daten['Netzwerkeffekte'] else 0
-        netzwerkeffekte_std = np.std(daten['Netzwerkeffekte']) if daten['Netzwerkeffekte'] else 0
-        netzwerkeffekte_min = min(daten['Netzwerkeffekte']) if daten['Netzwerkeffekte'] else 0
-        netzwerkeffekte_max = max(daten['Netzwerkeffekte']) if daten['Netzwerkeffekte'] else 0
-        
-        ergebnis_daten.append({
-            'Strategie': strategie,
-            'Kategorie': daten['Kategorie'],
-            'Anbieter_mean': anbieter_mean,
-            'Anbieter_std': anbieter_std,
-            'Anbieter_min': anbieter_min,
-            'Anbieter_max': anbieter_max,
-            'Nachfrager_mean': nachfrager_mean,
-            'Nachfrager_std': nachfrager_std,
-            'Nachfrager_min': nachfrager_min,
-            'Nachfrager_max': nachfrager_max,
-            'Netzwerkeffekte_mean': netzwerkeffekte_mean,
-            'Netzwerkeffekte_std': netzwerkeffekte_std,
-            'Netzwerkeffekte_min': netzwerkeffekte_min,
-            'Netzwerkeffekte_max': netzwerkeffekte_max
-        })
+    for strategie, (kategorie, zustand) in akkumulatoren.items():
+        zeile = {'Strategie': strategie, 'Kategorie': kategorie}
+        for j, spalte in enumerate(END_SPALTEN):
+            zeile[f'{spalte}_mean'] = zustand[j, _MEAN]
+            zeile[f'{spalte}_std'] = np.sqrt(zustand[j, _M2] / zustand[j, _N])
+            zeile[f'{spalte}_min'] = zustand[j, _MIN]
+            zeile[f'{spalte}_max'] = zustand[j, _MAX]
+        ergebnis_daten.append(zeile)
     
     # Erstelle DataFrame und sortiere nach Netzwerkeffekten
     ergebnis_df = pd.DataFrame(ergebnis_daten)
@@ -125,8 +272,12 @@ def extrahiere_anbieter_nachfrager_daten(basis_verzeichnis):
     ergebnis_df.to_csv(os.path.join(ausgabe_verzeichnis, "anbieter_nachfrager_statistik.csv"), index=False)
     
     # Erstelle eine vereinfachte Tabelle nur mit Mittelwerten für den Hauptteil
-    einfache_tabelle = ergebnis_df[['Strategie', 'Kategorie', 'Anbieter_mean', 'Nachfrager_mean', 'Netzwerkeffekte_mean']]
-    einfache_tabelle.to_csv(os.path.join(ausgabe_verzeichnis, "anbieter_nachfrager_mittelwerte.csv"), index=False)
+    # (Spaltenauswahl direkt beim Schreiben, ohne eine Kopie des DataFrames anzulegen)
+    ergebnis_df.to_csv(
+        os.path.join(ausgabe_verzeichnis, "anbieter_nachfrager_mittelwerte.csv"),
+        columns=['Strategie', 'Kategorie', 'Anbieter_mean', 'Nachfrager_mean', 'Netzwerkeffekte_mean'],
+        index=False
+    )
     
     print(f"\nTop 10 Strategien mit Anbieter- und Nachfragerzahlen:")
     for idx, row in ergebnis_df.head(10).iterrows():
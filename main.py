@@ -1,11 +1,13 @@
 import pandas as pd
 import numpy as np
 import itertools
+import functools
 import argparse
 import time
 import os
-import shutil
+import multiprocessing as mp
 from plattform_model import PlattformModel
+from speicherung import speichere_rohdaten, markiere_abgeschlossen
 from strategie_cluster import (
     # Einzelne Maßnahmen
     sem, social_media_marketing, affiliate_marketing,
@@ -19,11 +21,11 @@ from strategie_cluster import (
     community_cluster, nachhaltigkeit_cluster,
     
     # Alle Cluster
-    alle_cluster
+    alle_cluster, CLUSTER_NAMES, ALLE_EFFEKTE
 )
 
 def run_simulation(anbieter=110, nachfrager=7788, aktive_cluster=None, schritte=365, 
-                  seed=None, output_file="simulation_ergebnisse.csv"):
+                  seed=None, output_file="simulation_ergebnisse.csv", verbose=False, collect_timeseries=True):
     """
     Führt die Plattform-Simulation mit den angegebenen Parametern aus.
     
@@ -33,7 +35,10 @@ def run_simulation(anbieter=110, nachfrager=7788, aktive_cluster=None, schritte=
         aktive_cluster (list): Liste der aktiven Strategie-Cluster
         schritte (int): Anzahl der Simulationsschritte (Tage)
         seed (int, optional): Seed für den Zufallszahlengenerator zur Reproduzierbarkeit
-        output_file (str): Name der Ausgabedatei für die Ergebnisse
+        output_file (str): Pfad der Ausgabedatei für die Ergebnisse (die Endung richtet sich
+            nach dem Speicherformat, siehe speicherung.speichere_rohdaten)
+        verbose (bool): Fortschritts- und Debug-Ausgaben der einzelnen Läufe anzeigen
+        collect_timeseries (bool): Zeitreihe jedes Laufs erfassen und als Simulationsdatei speichern
     
     Returns:
         dict: Die letzten Werte der Simulationsdaten als Dictionary
@@ -44,100 +49,262 @@ def run_simulation(anbieter=110, nachfrager=7788, aktive_cluster=None, schritte=
     # Strategie-Namen für Logging
     strategie_namen = [c.name for c in aktive_cluster]
     
-    print(f"Starte Simulation mit {len(aktive_cluster)} aktiven Strategien: {strategie_namen}")
-    print(f"Anfangsbestand: {anbieter} Anbieter, {nachfrager} Nachfrager")
-    if seed is not None:
-        print(f"Verwende Random-Seed: {seed}")
-    
-    # Debug-Ausgabe der Cluster-Effekte
-    for cluster in aktive_cluster:
-        print(f"Cluster: {cluster.name}, Effekt: {cluster.effekt}")
+    if verbose:
+        print(f"Starte Simulation mit {len(aktive_cluster)} aktiven Strategien: {strategie_namen}")
+        print(f"Anfangsbestand: {anbieter} Anbieter, {nachfrager} Nachfrager")
+        if seed is not None:
+            print(f"Verwende Random-Seed: {seed}")
+        
+        # Debug-Ausgabe der Cluster-Effekte
+        for cluster in aktive_cluster:
+            print(f"Cluster: {cluster.name}, Effekt: {cluster.effekt}")
     
-    model = PlattformModel(anbieter, nachfrager, aktive_cluster, seed=seed)
+    model = PlattformModel(anbieter, nachfrager, aktive_cluster, seed=seed, verbose=verbose, schritte=schritte,
+                           collect_timeseries=collect_timeseries)
     
     for i in range(schritte):
         model.step()
-        if i % 30 == 0:  # Fortschrittsanzeige alle 30 Tage
+        if verbose and i % 30 == 0:  # Fortschrittsanzeige alle 30 Tage
             print(f"Simulationstag {i+1} von {schritte}")
     
+    # Ohne Zeitreihe enthält der Sammler nur die Werte des letzten Schritts
     data = model.datacollector.get_model_vars_dataframe()
+    if not collect_timeseries:
+        output_file = None
     if output_file:
-        data.to_csv(output_file, index=True)
-        print(f"Simulation abgeschlossen. Ergebnisse in '{output_file}' gespeichert.")
+        output_file = speichere_rohdaten(data, os.path.splitext(output_file)[0], index=True)
+        if verbose:
+            print(f"Simulation abgeschlossen. Ergebnisse in '{output_file}' gespeichert.")
     
     # Füge Metadaten zur Simulation hinzu für spätere Analyse
     letzte_werte = data.iloc[-1].to_dict()
     letzte_werte['Strategien'] = ', '.join(strategie_namen)
+    # Bei Mehrfachläufen ein per generate_state abgeleiteter Wert, nicht der Basis-Seed der Kommandozeile
     letzte_werte['Seed'] = seed
-    letzte_werte['Dateiname'] = output_file
+    letzte_werte['Dateiname'] = os.path.basename(output_file) if output_file else output_file
     
     return letzte_werte
 
-def run_multiple_simulations(anbieter=110, nachfrager=7788, aktive_cluster=None, 
-                           schritte=365, anzahl_simulationen=3, seed_start=42):
+@functools.lru_cache(maxsize=None)
+def strategie_slug(cluster_namen):
     """
-    Führt mehrere Simulationen mit den gleichen Parametern aber unterschiedlichen Seeds durch.
+    Erstellt den Strategienamen für Dateinamen aus den Namen der aktiven Cluster.
+    
+    Das Ergebnis wird zwischengespeichert, da dieselben Cluster-Kombinationen
+    für jeden Lauf und jede Auswertung erneut benötigt werden.
+    
+    Args:
+        cluster_namen (tuple): Namen der aktiven Strategie-Cluster
+    
+    Returns:
+        str: Strategienamen in Kleinbuchstaben, durch Unterstriche verbunden
+    """
+    return '_'.join([name.replace(' & ', '_').replace(' ', '_').lower() for name in cluster_namen])
+
+def erzeuge_seeds(seed_start, anzahl):
+    """
+    Leitet aus einem Basis-Seed Seeds für einzelne Läufe ab.
+    
+    Jeder Lauf erhält eine eigene Kind-Sequenz einer numpy.random.SeedSequence, aus
+    der per generate_state eine 64-Bit-Zahl gebildet wird. Diese Zahl initialisiert im
+    Modell den NumPy-Generator, das random-Modul und den Zufallsgenerator von Mesa.
+    Unabhängig sind damit nur die Kind-Sequenzen selbst: Die abgeleiteten Seeds
+    verschiedener Läufe sind lediglich mit hoher Wahrscheinlichkeit verschieden
+    (Kollisionen sind bei 64 Bit praktisch ausgeschlossen, aber nicht unmöglich).
+    Als ganze Zahlen können sie an das Modell übergeben und in Dateinamen verwendet werden.
+    
+    Args:
+        seed_start (int | numpy.random.SeedSequence): Basis-Seed
+        anzahl (int): Anzahl der benötigten Seeds
+    
+    Returns:
+        list: Ganzzahlige 64-Bit-Seeds, einer pro Lauf
+    """
+    if not isinstance(seed_start, np.random.SeedSequence):
+        seed_start = np.random.SeedSequence(seed_start)
+    return [int(kind.generate_state(1, np.uint64)[0]) for kind in seed_start.spawn(anzahl)]
+
+def _run_simulation_job(job):
+    """
+    Führt einen einzelnen Simulationslauf in einem Worker-Prozess aus.
+    
+    Args:
+        job (dict): Schlüsselwortargumente für run_simulation
+    
+    Returns:
+        dict: Die letzten Werte der Simulationsdaten als Dictionary
+    """
+    return run_simulation(**job)
+
+def erstelle_simulationsjobs(anbieter, nachfrager, aktive_cluster, schritte, seeds,
+                             output_dir=".", verbose=False, collect_timeseries=False):
+    """
+    Erstellt die Jobs für mehrere Simulationsläufe einer Konfiguration.
+    
+    Die Läufe unterscheiden sich nur im Seed und sind voneinander unabhängig. Die Seeds
+    sind keine vom Nutzer gewählten Werte, sondern per generate_state aus Kind-Sequenzen
+    des Basis-Seeds abgeleitet (siehe erzeuge_seeds); sie landen in der Spalte 'Seed'
+    und im Dateinamen, damit sich ein einzelner Lauf reproduzieren lässt.
     
     Args:
         anbieter (int): Anzahl der Anbieter zu Beginn
         nachfrager (int): Anzahl der Nachfrager zu Beginn
         aktive_cluster (list): Liste der aktiven Strategie-Cluster
         schritte (int): Anzahl der Simulationsschritte (Tage)
-        anzahl_simulationen (int): Anzahl der durchzuführenden Simulationen
-        seed_start (int): Startwert für die Random-Seeds
+        seeds (list): Ein per generate_state abgeleiteter Seed pro durchzuführender Simulation
+        output_dir (str): Verzeichnis, in das die Ergebnisdateien geschrieben werden
+        verbose (bool): Fortschritts- und Debug-Ausgaben der einzelnen Läufe anzeigen
+        collect_timeseries (bool): Zeitreihe jedes Laufs erfassen und als Simulationsdatei speichern
     
     Returns:
-        pandas.DataFrame: Zusammenfassung der Simulationsergebnisse mit Mittelwerten und Standardabweichungen
+        list: Schlüsselwortargumente für run_simulation, ein Eintrag pro Lauf
     """
-    if aktive_cluster is None:
-        aktive_cluster = [sichtbarkeit_cluster]
-        
-    strategie_string = '_'.join([c.name.replace(' & ', '_').replace(' ', '_').lower() for c in aktive_cluster])
+    strategie_string = strategie_slug(tuple(c.name for c in aktive_cluster))
     
-    ergebnisse = []
-    for sim_nr in range(anzahl_simulationen):
-        seed = seed_start + sim_nr
-        output_file = f"simulation_{strategie_string}_run{sim_nr+1}_seed{seed}.csv"
+    jobs = []
+    for sim_nr, seed in enumerate(seeds):
+        output_file = os.path.join(output_dir, f"simulation_{strategie_string}_run{sim_nr+1}_seed{seed}.csv")
         
-        print(f"\nSimulation {sim_nr+1} von {anzahl_simulationen} mit Seed {seed}")
-        resultat = run_simulation(
-            anbieter=anbieter, 
-            nachfrager=nachfrager, 
-            aktive_cluster=aktive_cluster,
-            schritte=schritte,
-            seed=seed,
-            output_file=output_file
-        )
-        ergebnisse.append(resultat)
+        jobs.append({
+            'anbieter': anbieter, 
+            'nachfrager': nachfrager, 
+            'aktive_cluster': aktive_cluster,
+            'schritte': schritte,
+            'seed': seed,
+            'output_file': output_file,
+            'verbose': verbose,
+            'collect_timeseries': collect_timeseries
+        })
+    return jobs
+
+def fuehre_jobs_aus(jobs, n_prozesse=None):
+    """
+    Führt Simulationsjobs parallel in einem Prozesspool aus.
+    
+    Die Jobs werden einzeln an freie Prozesse vergeben (chunksize=1), damit sich
+    lange und kurze Konfigurationen gleichmäßig auf alle Kerne verteilen.
+    
+    Args:
+        jobs (list): Schlüsselwortargumente für run_simulation
+        n_prozesse (int, optional): Anzahl paralleler Prozesse (Standard: Anzahl der CPU-Kerne)
+    
+    Returns:
+        list: Die Ergebnisse der Läufe in der Reihenfolge der Jobs
+    """
+    n_prozesse = n_prozesse or mp.cpu_count()
+    with mp.Pool(max(1, min(n_prozesse, len(jobs)))) as pool:
+        return pool.map(_run_simulation_job, jobs, chunksize=1)
+
+def werte_simulationen_aus(aktive_cluster, ergebnisse, output_dir="."):
+    """
+    Fasst die Ergebnisse mehrerer Simulationsläufe einer Konfiguration zusammen.
+    
+    Args:
+        aktive_cluster (list): Liste der aktiven Strategie-Cluster
+        ergebnisse (list): Die letzten Werte der einzelnen Läufe
+        output_dir (str): Verzeichnis, in das die Ergebnisdateien geschrieben werden
+    
+    Returns:
+        pandas.DataFrame: Zusammenfassung der Simulationsergebnisse mit Mittelwerten und Standardabweichungen
+    """
+    strategie_string = strategie_slug(tuple(c.name for c in aktive_cluster))
     
     # Erstelle ein DataFrame mit allen Simulationsergebnissen
     ergebnisse_df = pd.DataFrame(ergebnisse)
     
     # Berechne Mittelwerte und Standardabweichungen für numerische Spalten
-    numerische_spalten = ergebnisse_df.select_dtypes(include=[np.number]).columns
-    zusammenfassung = pd.DataFrame({
-        'Mittelwert': ergebnisse_df[numerische_spalten].mean(),
-        'Std.Abw.': ergebnisse_df[numerische_spalten].std(),
-        'Min': ergebnisse_df[numerische_spalten].min(),
-        'Max': ergebnisse_df[numerische_spalten].max()
-    })
+    num_df = ergebnisse_df.select_dtypes(include=[np.number])
+    zusammenfassung = num_df.agg(['mean', 'std', 'min', 'max']).T.rename(
+        columns={'mean': 'Mittelwert', 'std': 'Std.Abw.', 'min': 'Min', 'max': 'Max'}
+    )
     
     # Speichere die Detailergebnisse und die Zusammenfassung
-    ergebnisse_df.to_csv(f"ergebnisse_detail_{strategie_string}.csv", index=False)
-    zusammenfassung.to_csv(f"ergebnisse_zusammenfassung_{strategie_string}.csv")
+    speichere_rohdaten(ergebnisse_df, os.path.join(output_dir, f"ergebnisse_detail_{strategie_string}"))
+    speichere_rohdaten(zusammenfassung, os.path.join(output_dir, f"ergebnisse_zusammenfassung_{strategie_string}"), index=True)
     
     print(f"\nZusammenfassung für Strategie(n): {', '.join([c.name for c in aktive_cluster])}")
     print(f"Durchschnittliche Netzwerkeffekte: {ergebnisse_df['Netzwerkeffekte'].mean():.2f} (±{ergebnisse_df['Netzwerkeffekte'].std():.2f})")
     
     return zusammenfassung
 
-def simuliere_einzelmassnahmen(anzahl_simulationen=3, seed_start=42):
+def run_multiple_simulations(anbieter=110, nachfrager=7788, aktive_cluster=None, 
+                           schritte=365, anzahl_simulationen=3, seed_start=42, n_prozesse=None,
+                           output_dir=".", verbose=False, collect_timeseries=False):
+    """
+    Führt mehrere Simulationen mit den gleichen Parametern aber unterschiedlichen Seeds durch.
+    
+    Args:
+        anbieter (int): Anzahl der Anbieter zu Beginn
+        nachfrager (int): Anzahl der Nachfrager zu Beginn
+        aktive_cluster (list): Liste der aktiven Strategie-Cluster
+        schritte (int): Anzahl der Simulationsschritte (Tage)
+        anzahl_simulationen (int): Anzahl der durchzuführenden Simulationen
+        seed_start (int | numpy.random.SeedSequence): Basis-Seed, aus dem die Seeds der Läufe abgeleitet werden
+        n_prozesse (int, optional): Anzahl paralleler Prozesse (Standard: Anzahl der CPU-Kerne)
+        output_dir (str): Verzeichnis, in das die Ergebnisdateien geschrieben werden
+        verbose (bool): Fortschritts- und Debug-Ausgaben der einzelnen Läufe anzeigen
+        collect_timeseries (bool): Zeitreihe jedes Laufs erfassen und als Simulationsdatei speichern
+    
+    Returns:
+        pandas.DataFrame: Zusammenfassung der Simulationsergebnisse mit Mittelwerten und Standardabweichungen
+    """
+    if aktive_cluster is None:
+        aktive_cluster = [sichtbarkeit_cluster]
+    
+    return simuliere_konfigurationen(
+        [(aktive_cluster, erzeuge_seeds(seed_start, anzahl_simulationen))], anbieter, nachfrager, schritte,
+        n_prozesse, output_dir, verbose, collect_timeseries
+    )[0]
+
+def simuliere_konfigurationen(konfigurationen, anbieter=110, nachfrager=7788, schritte=365,
+                              n_prozesse=None, output_dir=".", verbose=False, collect_timeseries=False):
+    """
+    Führt die Simulationsläufe mehrerer Konfigurationen gemeinsam in einem Prozesspool aus.
+    
+    Args:
+        konfigurationen (list): Paare aus (aktive_cluster, seeds) mit einem Seed pro Lauf
+        anbieter (int): Anzahl der Anbieter zu Beginn
+        nachfrager (int): Anzahl der Nachfrager zu Beginn
+        schritte (int): Anzahl der Simulationsschritte (Tage)
+        n_prozesse (int, optional): Anzahl paralleler Prozesse (Standard: Anzahl der CPU-Kerne)
+        output_dir (str): Verzeichnis, in das die Ergebnisdateien geschrieben werden
+        verbose (bool): Fortschritts- und Debug-Ausgaben der einzelnen Läufe anzeigen
+        collect_timeseries (bool): Zeitreihe jedes Laufs erfassen und als Simulationsdatei speichern
+    
+    Returns:
+        list: Eine Zusammenfassung (pandas.DataFrame) pro Konfiguration, in gleicher Reihenfolge
+    """
+    jobs = []
+    for aktive_cluster, seeds in konfigurationen:
+        jobs.extend(erstelle_simulationsjobs(
+            anbieter, nachfrager, aktive_cluster, schritte, seeds, output_dir, verbose, collect_timeseries
+        ))
+    
+    print(f"\nStarte {len(jobs)} Simulationen für {len(konfigurationen)} Konfiguration(en)")
+    ergebnisse = fuehre_jobs_aus(jobs, n_prozesse)
+    
+    # Ergebnisse wieder den Konfigurationen zuordnen
+    zusammenfassungen = []
+    start = 0
+    for aktive_cluster, seeds in konfigurationen:
+        zusammenfassungen.append(werte_simulationen_aus(
+            aktive_cluster, ergebnisse[start:start + len(seeds)], output_dir
+        ))
+        start += len(seeds)
+    return zusammenfassungen
+
+def simuliere_einzelmassnahmen(anzahl_simulationen=3, seed_start=42, n_prozesse=None,
+                               output_dir=".", verbose=False, collect_timeseries=False):
     """
     Simuliert jede einzelne Maßnahme separat mit mehrfachen Simulationsläufen.
     
     Args:
         anzahl_simulationen (int): Anzahl der Simulationen pro Maßnahme
-        seed_start (int): Startwert für die Random-Seeds
+        seed_start (int | numpy.random.SeedSequence): Basis-Seed, aus dem die Seeds der Läufe abgeleitet werden
+        n_prozesse (int, optional): Anzahl paralleler Prozesse (Standard: Anzahl der CPU-Kerne)
+        output_dir (str): Verzeichnis, in das die Ergebnisdateien geschrieben werden
+        verbose (bool): Fortschritts- und Debug-Ausgaben der einzelnen Läufe anzeigen
+        collect_timeseries (bool): Zeitreihe jedes Laufs erfassen und als Simulationsdatei speichern
     
     Returns:
         pandas.DataFrame: Zusammenfassung der Simulationsergebnisse
@@ -156,15 +323,20 @@ def simuliere_einzelmassnahmen(anzahl_simulationen=3, seed_start=42):
         nachhaltige_produktfilter, regionale_kooperationen
     ]
     
+    # Alle Maßnahmen verwenden dieselben Seeds, damit sie unter gleichen Zufallsbedingungen verglichen werden
+    seeds = erzeuge_seeds(seed_start, anzahl_simulationen)
+    
+    # Alle Läufe aller Maßnahmen gemeinsam auf die Prozesse verteilen
+    zusammenfassungen = simuliere_konfigurationen(
+        [([massnahme], seeds) for massnahme in einzelmassnahmen],
+        n_prozesse=n_prozesse,
+        output_dir=output_dir,
+        verbose=verbose,
+        collect_timeseries=collect_timeseries
+    )
+    
     ergebnisse = []
-    for massnahme in einzelmassnahmen:
-        print(f"\nSimuliere Maßnahme: {massnahme.name}")
-        zusammenfassung = run_multiple_simulations(
-            aktive_cluster=[massnahme],
-            anzahl_simulationen=anzahl_simulationen,
-            seed_start=seed_start
-        )
-        
+    for massnahme, zusammenfassung in zip(einzelmassnahmen, zusammenfassungen):
         # Extrahiere den Mittelwert der Netzwerkeffekte
         netzwerkeffekt = zusammenfassung.loc['Netzwerkeffekte', 'Mittelwert']
         std_abw = zusammenfassung.loc['Netzwerkeffekte', 'Std.Abw.']
@@ -179,7 +351,7 @@ def simuliere_einzelmassnahmen(anzahl_simulationen=3, seed_start=42):
     # Erstelle Zusammenfassung
     zusammenfassung_df = pd.DataFrame(ergebnisse)
     zusammenfassung_df = zusammenfassung_df.sort_values(by='Netzwerkeffekte', ascending=False)
-    zusammenfassung_df.to_csv("zusammenfassung_einzelmassnahmen.csv", index=False)
+    speichere_rohdaten(zusammenfassung_df, os.path.join(output_dir, "zusammenfassung_einzelmassnahmen"))
     
     print("\nZusammenfassung der Einzelmaßnahmen nach Netzwerkeffekten:")
     for idx, row in zusammenfassung_df.iterrows():
@@ -187,28 +359,38 @@ def simuliere_einzelmassnahmen(anzahl_simulationen=3, seed_start=42):
     
     return zusammenfassung_df
 
-def simuliere_cluster(anzahl_simulationen=3, seed_start=100):
+def simuliere_cluster(anzahl_simulationen=3, seed_start=100, n_prozesse=None,
+                      output_dir=".", verbose=False, collect_timeseries=False):
     """
     Simuliert jeden Cluster separat mit mehrfachen Simulationsläufen.
     
     Args:
         anzahl_simulationen (int): Anzahl der Simulationen pro Cluster
-        seed_start (int): Startwert für die Random-Seeds
+        seed_start (int | numpy.random.SeedSequence): Basis-Seed, aus dem die Seeds der Läufe abgeleitet werden
+        n_prozesse (int, optional): Anzahl paralleler Prozesse (Standard: Anzahl der CPU-Kerne)
+        output_dir (str): Verzeichnis, in das die Ergebnisdateien geschrieben werden
+        verbose (bool): Fortschritts- und Debug-Ausgaben der einzelnen Läufe anzeigen
+        collect_timeseries (bool): Zeitreihe jedes Laufs erfassen und als Simulationsdatei speichern
     
     Returns:
         pandas.DataFrame: Zusammenfassung der Simulationsergebnisse
     """
     print("\n=== SIMULATION EINZELNER CLUSTER ===")
     
+    # Alle Cluster verwenden dieselben Seeds, damit sie unter gleichen Zufallsbedingungen verglichen werden
+    seeds = erzeuge_seeds(seed_start, anzahl_simulationen)
+    
+    # Alle Läufe aller Cluster gemeinsam auf die Prozesse verteilen
+    zusammenfassungen = simuliere_konfigurationen(
+        [([cluster], seeds) for cluster in alle_cluster],
+        n_prozesse=n_prozesse,
+        output_dir=output_dir,
+        verbose=verbose,
+        collect_timeseries=collect_timeseries
+    )
+    
     ergebnisse = []
-    for cluster in alle_cluster:
-        print(f"\nSimuliere Cluster: {cluster.name}")
-        zusammenfassung = run_multiple_simulations(
-            aktive_cluster=[cluster],
-            anzahl_simulationen=anzahl_simulationen,
-            seed_start=seed_start
-        )
-        
+    for cluster, zusammenfassung in zip(alle_cluster, zusammenfassungen):
         # Extrahiere den Mittelwert der Netzwerkeffekte
         netzwerkeffekt = zusammenfassung.loc['Netzwerkeffekte', 'Mittelwert']
         std_abw = zusammenfassung.loc['Netzwerkeffekte', 'Std.Abw.']
@@ -223,7 +405,7 @@ def simuliere_cluster(anzahl_simulationen=3, seed_start=100):
     # Erstelle Zusammenfassung
     zusammenfassung_df = pd.DataFrame(ergebnisse)
     zusammenfassung_df = zusammenfassung_df.sort_values(by='Netzwerkeffekte', ascending=False)
-    zusammenfassung_df.to_csv("zusammenfassung_cluster.csv", index=False)
+    speichere_rohdaten(zusammenfassung_df, os.path.join(output_dir, "zusammenfassung_cluster"))
     
     print("\nZusammenfassung der Cluster nach Netzwerkeffekten:")
     for idx, row in zusammenfassung_df.iterrows():
@@ -231,77 +413,75 @@ def simuliere_cluster(anzahl_simulationen=3, seed_start=100):
     
     return zusammenfassung_df
 
-def simuliere_clusterkombinationen(anzahl_simulationen=3, seed_start=200):
+def simuliere_clusterkombinationen(anzahl_simulationen=3, seed_start=200, n_prozesse=None,
+                                   output_dir=".", verbose=False, collect_timeseries=False):
     """
     Simuliert verschiedene Kombinationen von Clustern mit mehrfachen Simulationsläufen.
     
     Args:
         anzahl_simulationen (int): Anzahl der Simulationen pro Kombination
-        seed_start (int): Startwert für die Random-Seeds
+        seed_start (int | numpy.random.SeedSequence): Basis-Seed, aus dem die Seeds der Läufe abgeleitet werden
+        n_prozesse (int, optional): Anzahl paralleler Prozesse (Standard: Anzahl der CPU-Kerne)
+        output_dir (str): Verzeichnis, in das die Ergebnisdateien geschrieben werden
+        verbose (bool): Fortschritts- und Debug-Ausgaben der einzelnen Läufe anzeigen
+        collect_timeseries (bool): Zeitreihe jedes Laufs erfassen und als Simulationsdatei speichern
     
     Returns:
         pandas.DataFrame: Zusammenfassung der Simulationsergebnisse
     """
     print("\n=== SIMULATION VON CLUSTER-KOMBINATIONEN ===")
     
-    ergebnisse = []
-    seed = seed_start
+    # Alle Kombinationen von 2 und 3 Clustern sowie alle Cluster zusammen als flache Aufgabenliste
+    # (als Indizes in alle_cluster bzw. CLUSTER_NAMES und ALLE_EFFEKTE),
+    # jede Kombination erhält eine eigene Kind-Sequenz und damit eigene, unabhängige Seeds
+    cluster_indizes = range(len(alle_cluster))
+    kombinationen = list(itertools.chain(
+        itertools.combinations(cluster_indizes, 2),
+        itertools.combinations(cluster_indizes, 3),
+        [tuple(cluster_indizes)]
+    ))
+    if not isinstance(seed_start, np.random.SeedSequence):
+        seed_start = np.random.SeedSequence(seed_start)
+    konfigurationen = [
+        ([alle_cluster[i] for i in kombination], erzeuge_seeds(kind, anzahl_simulationen))
+        for kombination, kind in zip(kombinationen, seed_start.spawn(len(kombinationen)))
+    ]
     
-    # Generiere alle möglichen Kombinationen von 2 und 3 Clustern
-    for r in range(2, 4):  # 2 und 3 Cluster kombinieren
-        for kombination in itertools.combinations(alle_cluster, r):
-            cluster_namen = [c.name for c in kombination]
-            print(f"\nSimuliere Kombination: {', '.join(cluster_namen)}")
-            
-            zusammenfassung = run_multiple_simulations(
-                aktive_cluster=list(kombination),
-                anzahl_simulationen=anzahl_simulationen,
-                seed_start=seed
-            )
-            seed += anzahl_simulationen
-            
-            # Extrahiere den Mittelwert der Netzwerkeffekte
-            netzwerkeffekt = zusammenfassung.loc['Netzwerkeffekte', 'Mittelwert']
-            std_abw = zusammenfassung.loc['Netzwerkeffekte', 'Std.Abw.']
-            
-            # Berechne Summe der Einzel-Cluster-Effekte
-            summe_effekte = sum(c.effekt for c in kombination)
-            
-            ergebnisse.append({
-                'Strategie': ', '.join(cluster_namen),
-                'Netzwerkeffekte': netzwerkeffekt,
-                'Standardabweichung': std_abw,
-                'Summe Cluster-Effekte': summe_effekte,
-                'Anzahl Cluster': len(kombination)
-            })
-    
-    # Simulation mit allen Clustern
-    print("\nSimuliere alle Cluster zusammen")
-    zusammenfassung = run_multiple_simulations(
-        aktive_cluster=alle_cluster,
-        anzahl_simulationen=anzahl_simulationen,
-        seed_start=seed
+    # Alle Läufe gemeinsam auf die Prozesse verteilen
+    zusammenfassungen = simuliere_konfigurationen(
+        konfigurationen,
+        n_prozesse=n_prozesse,
+        output_dir=output_dir,
+        verbose=verbose,
+        collect_timeseries=collect_timeseries
     )
     
-    # Extrahiere den Mittelwert der Netzwerkeffekte
-    netzwerkeffekt = zusammenfassung.loc['Netzwerkeffekte', 'Mittelwert']
-    std_abw = zusammenfassung.loc['Netzwerkeffekte', 'Std.Abw.']
-    
-    # Berechne Summe der Einzel-Cluster-Effekte
-    summe_effekte = sum(c.effekt for c in alle_cluster)
-    
-    ergebnisse.append({
-        'Strategie': 'Alle Cluster',
-        'Netzwerkeffekte': netzwerkeffekt,
-        'Standardabweichung': std_abw,
-        'Summe Cluster-Effekte': summe_effekte,
-        'Anzahl Cluster': len(alle_cluster)
-    })
+    ergebnisse = []
+    for kombination, zusammenfassung in zip(kombinationen, zusammenfassungen):
+        # Extrahiere den Mittelwert der Netzwerkeffekte
+        netzwerkeffekt = zusammenfassung.loc['Netzwerkeffekte', 'Mittelwert']
+        std_abw = zusammenfassung.loc['Netzwerkeffekte', 'Std.Abw.']
+        
+        # Berechne Summe der Einzel-Cluster-Effekte
+        summe_effekte = ALLE_EFFEKTE[list(kombination)].sum()
+        
+        if len(kombination) == len(alle_cluster):
+            strategie = 'Alle Cluster'
+        else:
+            strategie = ', '.join(CLUSTER_NAMES[i] for i in kombination)
+        
+        ergebnisse.append({
+            'Strategie': strategie,
+            'Netzwerkeffekte': netzwerkeffekt,
+            'Standardabweichung': std_abw,
+            'Summe Cluster-Effekte': summe_effekte,
+            'Anzahl Cluster': len(kombination)
+        })
     
     # Erstelle Zusammenfassung
     zusammenfassung_df = pd.DataFrame(ergebnisse)
     zusammenfassung_df = zusammenfassung_df.sort_values(by='Netzwerkeffekte', ascending=False)
-    zusammenfassung_df.to_csv("zusammenfassung_clusterkombinationen.csv", index=False)
+    speichere_rohdaten(zusammenfassung_df, os.path.join(output_dir, "zusammenfassung_clusterkombinationen"))
     
     print("\nZusammenfassung der Cluster-Kombinationen nach Netzwerkeffekten:")
     for idx, row in zusammenfassung_df.iterrows():
@@ -309,7 +489,7 @@ def simuliere_clusterkombinationen(anzahl_simulationen=3, seed_start=200):
     
     return zusammenfassung_df
 
-def erstelle_gesamtvergleich(einzeln_df, cluster_df, kombinationen_df):
+def erstelle_gesamtvergleich(einzeln_df, cluster_df, kombinationen_df, output_dir="."):
     """
     Erstellt einen Gesamtvergleich aller Simulationen.
     
@@ -317,6 +497,7 @@ def erstelle_gesamtvergleich(einzeln_df, cluster_df, kombinationen_df):
         einzeln_df (pandas.DataFrame): Ergebnisse der Einzelmaßnahmen
         cluster_df (pandas.DataFrame): Ergebnisse der Cluster
         kombinationen_df (pandas.DataFrame): Ergebnisse der Cluster-Kombinationen
+        output_dir (str): Verzeichnis, in das die Ergebnisdateien geschrieben werden
     
     Returns:
         pandas.DataFrame: Gesamtvergleich aller Simulationen
@@ -334,7 +515,7 @@ def erstelle_gesamtvergleich(einzeln_df, cluster_df, kombinationen_df):
     
     # Speichern des Gesamtvergleichs
     timestamp = time.strftime("%Y%m%d_%H%M%S")
-    gesamtvergleich.to_csv(f"gesamtvergleich_aller_simulationen_{timestamp}.csv", index=False)
+    speichere_rohdaten(gesamtvergleich, os.path.join(output_dir, f"gesamtvergleich_aller_simulationen_{timestamp}"))
     
     print("\n=== VOLLSTÄNDIGES RANKING ALLER STRATEGIEN NACH NETZWERKEFFEKTEN ===")
     for index, row in gesamtvergleich.iterrows():
@@ -342,15 +523,19 @@ def erstelle_gesamtvergleich(einzeln_df, cluster_df, kombinationen_df):
     
     return gesamtvergleich
 
-def run_multiple_iterations(iterations=4, sim_runs=3, seed_start=42, tage=365):
+def run_multiple_iterations(iterations=4, sim_runs=3, seed_start=42, tage=365, n_prozesse=None,
+                            verbose=False, collect_timeseries=False):
     """
     Führt mehrere Iterationen der Simulationen durch.
     
     Args:
         iterations (int): Anzahl der Gesamtiterationen
         sim_runs (int): Anzahl der Simulationsläufe pro Konfiguration
-        seed_start (int): Basis-Seed für den ersten Durchlauf
+        seed_start (int): Basis-Seed, aus dem die Seeds aller Iterationen abgeleitet werden
         tage (int): Anzahl der simulierten Tage
+        n_prozesse (int, optional): Anzahl paralleler Prozesse (Standard: Anzahl der CPU-Kerne)
+        verbose (bool): Fortschritts- und Debug-Ausgaben der einzelnen Läufe anzeigen
+        collect_timeseries (bool): Zeitreihe jedes Laufs erfassen und als Simulationsdatei speichern
     
     Returns:
         None
@@ -360,24 +545,26 @@ def run_multiple_iterations(iterations=4, sim_runs=3, seed_start=42, tage=365):
     if not os.path.exists(basis_verzeichnis):
         os.makedirs(basis_verzeichnis)
     
+    # Jeder Durchlauf schreibt in eigene Verzeichnisse, frühere Ergebnisse bleiben unangetastet.
+    # Die Prozess-ID trennt Durchläufe, die in derselben Sekunde gestartet wurden.
+    run_id = f"{time.strftime('%Y%m%d_%H%M%S')}_{os.getpid()}"
+    print(f"Lauf-ID: {run_id}")
+    
+    # Unabhängige Seed-Sequenzen je Iteration und darin je Simulationsphase
+    # (Einzelmaßnahmen, Cluster, Kombinationen) statt fester Seed-Abstände
+    iteration_sequenzen = np.random.SeedSequence(seed_start).spawn(iterations)
+    
     # Führe die Iterationen durch
     for iteration in range(1, iterations + 1):
-        iteration_verzeichnis = os.path.join(basis_verzeichnis, f"iteration_{iteration}")
-        
-        # Falls der Ordner bereits existiert, lösche ihn und erstelle ihn neu
-        if os.path.exists(iteration_verzeichnis):
-            shutil.rmtree(iteration_verzeichnis)
-        os.makedirs(iteration_verzeichnis)
+        iteration_verzeichnis = os.path.join(basis_verzeichnis, f"iteration_{iteration}_{run_id}")
+        os.makedirs(iteration_verzeichnis, exist_ok=False)
         
-        # Wechsle ins Iterationsverzeichnis
-        current_dir = os.getcwd()
-        os.chdir(iteration_verzeichnis)
-        
-        iteration_seed = seed_start + (iteration - 1) * 10000
+        einzeln_seed, cluster_seed, kombinationen_seed = iteration_sequenzen[iteration - 1].spawn(3)
         
         print(f"\n\n{'='*80}")
         print(f"=== STARTE ITERATION {iteration} VON {iterations} ===")
-        print(f"=== Basis-Seed: {iteration_seed}, Simulationen pro Konfiguration: {sim_runs} ===")
+        print(f"=== Basis-Seed: {seed_start}, Spawn-Key der Iteration: {iteration_sequenzen[iteration - 1].spawn_key}, "
+              f"Simulationen pro Konfiguration: {sim_runs} ===")
         print(f"{'='*80}\n")
         
         try:
@@ -385,34 +572,46 @@ def run_multiple_iterations(iterations=4, sim_runs=3, seed_start=42, tage=365):
             print(f"Simuliere einzelne Maßnahmen...")
             einzeln_df = simuliere_einzelmassnahmen(
                 anzahl_simulationen=sim_runs, 
-                seed_start=iteration_seed
+                seed_start=einzeln_seed,
+                n_prozesse=n_prozesse,
+                output_dir=iteration_verzeichnis,
+                verbose=verbose,
+                collect_timeseries=collect_timeseries
             )
             
             # Cluster simulieren
             print(f"\nSimuliere Cluster...")
             cluster_df = simuliere_cluster(
                 anzahl_simulationen=sim_runs, 
-                seed_start=iteration_seed + 1000
+                seed_start=cluster_seed,
+                n_prozesse=n_prozesse,
+                output_dir=iteration_verzeichnis,
+                verbose=verbose,
+                collect_timeseries=collect_timeseries
             )
             
             # Cluster-Kombinationen simulieren
             print(f"\nSimuliere Cluster-Kombinationen...")
             kombinationen_df = simuliere_clusterkombinationen(
                 anzahl_simulationen=sim_runs, 
-                seed_start=iteration_seed + 2000
+                seed_start=kombinationen_seed,
+                n_prozesse=n_prozesse,
+                output_dir=iteration_verzeichnis,
+                verbose=verbose,
+                collect_timeseries=collect_timeseries
             )
             
             # Gesamtvergleich erstellen
             print(f"\nErstelle Gesamtvergleich...")
-            erstelle_gesamtvergleich(einzeln_df, cluster_df, kombinationen_df)
+            erstelle_gesamtvergleich(einzeln_df, cluster_df, kombinationen_df, output_dir=iteration_verzeichnis)
+            
+            # Erst jetzt ist die Iteration vollständig und wird von den Auswertungsskripten berücksichtigt
+            markiere_abgeschlossen(iteration_verzeichnis)
             
             print(f"\nIteration {iteration} abgeschlossen.")
             
         except Exception as e:
             print(f"\nFehler in Iteration {iteration}: {str(e)}")
-        
-        # Zurück zum Hauptverzeichnis
-        os.chdir(current_dir)
     
     print("\nAlle Iterationen abgeschlossen. Verwende das Skript 'erstelle_zusammenfassung.py', um die Gesamtergebnisse zu aggregieren.")
 
@@ -423,6 +622,11 @@ if __name__ == "__main__":
     parser.add_argument('--runs', type=int, default=3, help='Anzahl der Simulationen pro Konfiguration')
     parser.add_argument('--days', type=int, default=365, help='Anzahl der simulierten Tage')
     parser.add_argument('--seed', type=int, default=42, help='Basis-Seed für den ersten Durchlauf')
+    parser.add_argument('--prozesse', type=int, default=None, help='Anzahl paralleler Prozesse (Standard: Anzahl der CPU-Kerne)')
+    parser.add_argument('--verbose', action='store_true', help='Fortschritts- und Debug-Ausgaben der einzelnen Läufe anzeigen')
+    parser.add_argument('--mit-zeitreihen', action='store_true',
+                        help='Zeitreihen der einzelnen Läufe erfassen und als Simulationsdateien speichern '
+                             '(Standard: nur die Endwerte der Läufe)')
     
     args = parser.parse_args()
     
@@ -431,5 +635,8 @@ if __name__ == "__main__":
         iterations=args.iterations,
         sim_runs=args.runs,
         seed_start=args.seed,
-        tage=args.days
+        tage=args.days,
+        n_prozesse=args.prozesse,
+        verbose=args.verbose,
+        collect_timeseries=args.mit_zeitreihen
     )
\ No newline at end of file
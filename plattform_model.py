@@ -1,9 +1,196 @@
 import random
 from collections import deque
+import numpy as np
+import pandas as pd
 from mesa import Model
 from mesa.time import RandomActivation
-from mesa.datacollection import DataCollector
-from akteure import Anbieter, Nachfrager
+from akteure import Anbieter, Nachfrager, ANBIETER
+from abwanderung import abwanderung_anbieter, abwanderung_nachfrager
+
+class GleitendesFenster:
+    """
+    Speichert die zuletzt angehängten Werte und führt deren Summe laufend mit.
+    
+    Verhält sich beim Anhängen, Indizieren und bei len() wie eine deque mit maxlen,
+    der Mittelwert steht aber ohne erneutes Aufsummieren in O(1) zur Verfügung.
+    
+    Attributes:
+        _np_sum (float): Summe der aktuell gespeicherten Werte
+    """
+    
+    def __init__(self, maxlen):
+        """
+        Initialisiert ein leeres Fenster.
+        
+        Args:
+            maxlen (int): Maximale Anzahl gespeicherter Werte
+        """
+        self._werte = deque(maxlen=maxlen)
+        self._np_sum = 0.0
+
+    def append(self, wert):
+        """
+        Hängt einen Wert an und verdrängt bei vollem Fenster den ältesten Wert.
+        
+        Args:
+            wert (float): Der anzuhängende Wert
+        """
+        if len(self._werte) == self._werte.maxlen:
+            self._np_sum -= self._werte[0]
+        self._werte.append(wert)
+        self._np_sum += wert
+
+    def mittelwert(self):
+        """
+        Gibt den Mittelwert der gespeicherten Werte zurück.
+        
+        Returns:
+            float: Mittelwert über alle Werte im Fenster
+        """
+        return self._np_sum / len(self._werte)
+
+    def __len__(self):
+        return len(self._werte)
+
+    def __getitem__(self, index):
+        return self._werte[index]
+
+
+class ZeitreihenSammler:
+    """
+    Erfasst die Modellvariablen jedes Schritts in einem vorab angelegten NumPy-Array.
+    
+    Ersetzt den DataCollector von Mesa mit derselben Schnittstelle (collect und
+    get_model_vars_dataframe). Statt je Schritt und Kennzahl in Listen anzuhängen,
+    wird pro Schritt eine Zeile eines zusammenhängenden Arrays gefüllt, aus dem am
+    Ende in einem Aufruf das DataFrame entsteht. Reicht die Kapazität nicht aus,
+    wird sie verdoppelt. Wird keine Zeitreihe benötigt, bleibt nur der zuletzt
+    erfasste Schritt erhalten.
+    
+    Attributes:
+        spalten (list): Namen der erfassten Kennzahlen in Spaltenreihenfolge
+    """
+    
+    def __init__(self, model_reporters, kapazitaet=365, nur_letzter_schritt=False):
+        """
+        Initialisiert den Sammler.
+        
+        Args:
+            model_reporters (dict): Spaltenname -> Attributname des Modells (str, wird
+                als ganze Zahl gespeichert) oder Methode ohne Argumente
+            kapazitaet (int): Anzahl der Schritte, für die vorab Platz reserviert wird
+            nur_letzter_schritt (bool): Nur die Werte des zuletzt erfassten Schritts behalten
+        """
+        self.spalten = list(model_reporters)
+        self._reporter = [(reporter, isinstance(reporter, str)) for reporter in model_reporters.values()]
+        self._ganzzahlig = [name for name, reporter in model_reporters.items() if isinstance(reporter, str)]
+        self._nur_letzter_schritt = nur_letzter_schritt
+        if nur_letzter_schritt:
+            kapazitaet = 1
+        self._daten = np.empty((max(1, kapazitaet), len(self.spalten)), dtype=np.float64)
+        self._anzahl = 0
+
+    def collect(self, model):
+        """
+        Erfasst die aktuellen Werte aller Kennzahlen als neue Zeile.
+        
+        Args:
+            model (PlattformModel): Das Modell, dessen Werte erfasst werden
+        """
+        if self._nur_letzter_schritt:
+            self._anzahl = 0  # Die einzige Zeile wird überschrieben
+        elif self._anzahl == len(self._daten):
+            self._daten = np.concatenate((self._daten, np.empty_like(self._daten)))
+        zeile = self._daten[self._anzahl]
+        for j, (reporter, ist_attribut) in enumerate(self._reporter):
+            zeile[j] = getattr(model, reporter) if ist_attribut else reporter()
+        self._anzahl += 1
+
+    def get_model_vars_dataframe(self):
+        """
+        Gibt alle erfassten Werte als DataFrame zurück (eine Zeile pro Schritt).
+        
+        Returns:
+            pandas.DataFrame: Zeitreihe aller Kennzahlen, Zähler als ganze Zahlen
+        """
+        df = pd.DataFrame(self._daten[:self._anzahl], columns=self.spalten)
+        return df.astype({spalte: np.int64 for spalte in self._ganzzahlig})
+
+
+class TypisierteAktivierung(RandomActivation):
+    """
+    Zufällige Aktivierung, die zusätzlich eine Liste je Agententyp führt.
+    
+    Abfragen wie "alle Anbieter" müssen dadurch nicht mehr über alle Agenten
+    filtern. Nur Agenten der aktiven Typen werden in jedem Schritt aktiviert,
+    alle übrigen Agenten werden ausschließlich in ihrer Typliste geführt.
+    
+    Attributes:
+        agents_by_type (dict): Liste der Agenten je Agententyp
+        aktive_typen (tuple): Agententypen, deren step-Methode aufgerufen wird
+    """
+    
+    def __init__(self, model, aktive_typen=()):
+        """
+        Initialisiert das Aktivierungsschema.
+        
+        Args:
+            model (PlattformModel): Referenz zum übergeordneten Modell
+            aktive_typen (tuple): Agententypen, die in jedem Schritt aktiviert werden
+        """
+        super().__init__(model)
+        self.agents_by_type = {}
+        self.aktive_typen = tuple(aktive_typen)
+
+    def add(self, agent):
+        """
+        Fügt einen Agenten seiner Typliste und bei aktiven Typen der Aktivierung hinzu.
+        
+        Die Position in der Typliste wird am Agenten gespeichert, damit er später
+        in O(1) wieder entfernt werden kann.
+        
+        Args:
+            agent: Der hinzuzufügende Agent
+        """
+        liste = self.agents_of_type(type(agent))
+        agent._idx = len(liste)
+        liste.append(agent)
+        if type(agent) in self.aktive_typen:
+            super().add(agent)
+
+    def remove(self, agent):
+        """
+        Entfernt einen Agenten aus seiner Typliste und gegebenenfalls der Aktivierung.
+        
+        Der letzte Agent der Typliste rückt an die Stelle des entfernten Agenten
+        (Swap-Pop), sodass keine Elemente verschoben werden müssen.
+        
+        Args:
+            agent: Der zu entfernende Agent
+        """
+        liste = self.agents_by_type[type(agent)]
+        letzter = liste.pop()
+        if letzter is not agent:
+            liste[agent._idx] = letzter
+            letzter._idx = agent._idx
+        if type(agent) in self.aktive_typen:
+            super().remove(agent)
+
+    def agents_of_type(self, agent_type):
+        """
+        Gibt die Liste aller Agenten eines Typs zurück.
+        
+        Die Liste wird an Ort und Stelle gepflegt, eine einmal abgefragte Referenz
+        bleibt also über die gesamte Simulation gültig.
+        
+        Args:
+            agent_type (type): Der gesuchte Agententyp
+        
+        Returns:
+            list: Alle Agenten des angegebenen Typs
+        """
+        return self.agents_by_type.setdefault(agent_type, [])
+
 
 class PlattformModel(Model):
     """
@@ -14,16 +201,27 @@ class PlattformModel(Model):
     von Akteuren sowie die Entwicklung von Netzwerkeffekten über Zeit.
     
     Attributes:
-        schedule (RandomActivation): Aktivierungsschema für die Agenten
+        schedule (TypisierteAktivierung): Aktivierungsschema mit Typlisten, aktiviert werden nur die Nachfrager
         aktive_cluster (list): Liste der aktiven Strategiecluster
         N_anbieter (int): Initiale Anzahl der Anbieter
         N_nachfrager (int): Initiale Anzahl der Nachfrager
         next_id (int): Nächste verfügbare ID für neue Agenten
-        N_p_history (deque): Speichert die letzten 60 Netzwerkeffektwerte
+        N_p_history (GleitendesFenster): Speichert die letzten 60 Netzwerkeffektwerte
+        anbieter_list (list): Alle aktiven Anbieter (Typliste des Aktivierungsschemas)
+        nachfrager_list (list): Alle aktiven Nachfrager (Typliste des Aktivierungsschemas)
+        count_anbieter (int): Aktuelle Anzahl der Anbieter
+        count_nachfrager (int): Aktuelle Anzahl der Nachfrager
         seed (int): Seed für den Zufallszahlengenerator zur Reproduzierbarkeit
+        rng (numpy.random.Generator): Zufallszahlengenerator für gebündelte Ziehungen
+        verbose (bool): Ob Debug-Ausgaben angezeigt werden
+        datacollector (ZeitreihenSammler): Erfasst die Modellvariablen jedes Schritts
+            (ohne Zeitreihe nur die des letzten Schritts)
+        schritte (int): Erwartete Anzahl der Schritte
+        collect_timeseries (bool): Ob die Modellvariablen in jedem Schritt erfasst werden
     """
     
-    def __init__(self, N_anbieter, N_nachfrager, aktive_cluster, seed=None):
+    def __init__(self, N_anbieter, N_nachfrager, aktive_cluster, seed=None, verbose=False, schritte=365,
+                 collect_timeseries=True):
         """
         Initialisiert das Plattformmodell mit gegebenen Parametern.
         
@@ -32,18 +230,34 @@ class PlattformModel(Model):
             N_nachfrager (int): Anfängliche Anzahl der Nachfrager
             aktive_cluster (list): Liste der aktiven Strategiecluster
             seed (int, optional): Seed für den Zufallszahlengenerator zur Reproduzierbarkeit
+            verbose (bool): Debug-Ausgaben alle 30 Schritte anzeigen
+            schritte (int): Erwartete Anzahl der Schritte (Kapazität der Zeitreihe bzw.
+                Schritt, in dem ohne Zeitreihe erfasst wird)
+            collect_timeseries (bool): Werte aller Schritte erfassen statt nur des letzten Schritts
         """
-        # Setzen des Random-Seeds für Reproduzierbarkeit
+        # Setzen des Random-Seeds für die verbliebenen Ziehungen über das random-Modul
         self.seed = seed
         if seed is not None:
             random.seed(seed)
+        
+        # Generator (PCG64) für alle gebündelten Zufallsziehungen des Modells
+        self.rng = np.random.default_rng(seed)
             
-        self.schedule = RandomActivation(self)
+        self.verbose = verbose
+        self.schedule = TypisierteAktivierung(self, aktive_typen=(Nachfrager,))
         self.aktive_cluster = aktive_cluster
+        # Die aktiven Cluster ändern sich während eines Laufs nicht, ihr gewichteter
+        # Beitrag zum Netzwerkeffekt wird daher nur einmal berechnet
+        self._cluster_effekt_sum = 0.3 * sum(cluster.effekt for cluster in aktive_cluster)
         self.N_anbieter = N_anbieter
         self.N_nachfrager = N_nachfrager
         self.next_id = N_anbieter + N_nachfrager
-        self.N_p_history = deque(maxlen=60)  # Speichert Werte für 60 Tage
+        self.N_p_history = GleitendesFenster(maxlen=60)  # Speichert Werte für 60 Tage
+        
+        # Typlisten des Aktivierungsschemas, damit Nachfrager ohne Filterung über alle Agenten
+        # einen zufälligen Anbieter wählen können
+        self.anbieter_list = self.schedule.agents_of_type(Anbieter)
+        self.nachfrager_list = self.schedule.agents_of_type(Nachfrager)
         
         # Basis-Wahrscheinlichkeiten für Beitritte
         self.basis_wahrscheinlichkeit_anbieter = 0.015
@@ -53,40 +267,160 @@ class PlattformModel(Model):
         self.max_wahrscheinlichkeit_anbieter = 0.2
         self.max_wahrscheinlichkeit_nachfrager = 0.3
 
+        # Aktuelle Anzahl der Anbieter und Nachfrager (über register_join/register_leave gepflegt)
+        self.count_anbieter = 0
+        self.count_nachfrager = 0
+
         # Zähler für neue und abgewanderte Akteure
         self.neue_anbieter = 0
         self.neue_nachfrager = 0
         self.abgewanderte_anbieter = 0
         self.abgewanderte_nachfrager = 0
+        
+        # Einmal pro Schritt berechneter Netzwerkeffekt-Trend und daraus abgeleitete
+        # Abwanderungswahrscheinlichkeiten für Anbieter und Nachfrager
+        self._sinkt = False
+        self._p_anb = 0.0
+        self._p_nf = 0.0
+        
+        # Vorrat an im Voraus gezogenen Bewertungen (wird bei Bedarf in Nachfrager.bewerten aufgefüllt)
+        self._rating_pool = []
+        self._rating_idx = 0
+        
+        # Abwanderungsentscheidung der Nachfrager, ein Eintrag je Position in der
+        # Nachfragerliste (wird zu Beginn jedes Schritts neu bestimmt)
+        self._abwandernd_nf = np.zeros(0, dtype=bool)
+        
+        # Nachfrager, die im laufenden Schritt abgewandert sind und nach der Aktivierung
+        # gesammelt entfernt werden
+        self._abgewanderte_nf = []
 
         # Erstellen und Hinzufügen der initialen Anbieter
         for i in range(self.N_anbieter):
             anbieter = Anbieter(i, self)
-            self.schedule.add(anbieter)
+            self.agent_hinzufuegen(anbieter)
 
         # Erstellen und Hinzufügen der initialen Nachfrager
         for j in range(self.N_nachfrager):
             nachfrager = Nachfrager(self.N_anbieter + j, self)
-            self.schedule.add(nachfrager)
+            self.agent_hinzufuegen(nachfrager)
 
-        # Konfiguration des DataCollectors für die Erfassung von Modellvariablen
-        self.datacollector = DataCollector(
+        self.schritte = schritte
+        self.collect_timeseries = collect_timeseries
+        self._schritt = 0
+        
+        # Konfiguration der Zeitreihe für die Erfassung von Modellvariablen
+        # (Zähler werden direkt als Attribute gelesen, nur berechnete Werte als Methoden)
+        self.datacollector = ZeitreihenSammler(
             model_reporters={
-                "Anbieter": lambda m: sum(1 for a in m.schedule.agents if isinstance(a, Anbieter)),
-                "Nachfrager": lambda m: sum(1 for a in m.schedule.agents if isinstance(a, Nachfrager)),
+                "Anbieter": "count_anbieter",
+                "Nachfrager": "count_nachfrager",
                 "Netzwerkeffekte": self.berechne_netzwerkeffekte,
-                "Neue Anbieter": lambda m: m.neue_anbieter,
-                "Neue Nachfrager": lambda m: m.neue_nachfrager,
-                "Abgewanderte Anbieter": lambda m: m.abgewanderte_anbieter,
-                "Abgewanderte Nachfrager": lambda m: m.abgewanderte_nachfrager,
-                "Beitrittsrate Anbieter": lambda m: m.berechne_beitrittsrate_anbieter(),
-                "Beitrittsrate Nachfrager": lambda m: m.berechne_beitrittsrate_nachfrager(),
-            }
+                "Neue Anbieter": "neue_anbieter",
+                "Neue Nachfrager": "neue_nachfrager",
+                "Abgewanderte Anbieter": "abgewanderte_anbieter",
+                "Abgewanderte Nachfrager": "abgewanderte_nachfrager",
+                "Beitrittsrate Anbieter": self.berechne_beitrittsrate_anbieter,
+                "Beitrittsrate Nachfrager": self.berechne_beitrittsrate_nachfrager,
+            },
+            kapazitaet=schritte,
+            nur_letzter_schritt=not collect_timeseries
         )
         
         # Initial einen Netzwerkeffekt berechnen, um die History zu starten
         self.berechne_netzwerkeffekte()
 
+    def register_join(self, kind):
+        """
+        Erhöht den Zähler für den angegebenen Agententyp.
+        
+        Args:
+            kind (int): Typkennung des Agenten (ANBIETER oder NACHFRAGER)
+        """
+        if kind == ANBIETER:
+            self.count_anbieter += 1
+        else:
+            self.count_nachfrager += 1
+
+    def register_leave(self, kind):
+        """
+        Verringert den Zähler für den angegebenen Agententyp.
+        
+        Args:
+            kind (int): Typkennung des Agenten (ANBIETER oder NACHFRAGER)
+        """
+        if kind == ANBIETER:
+            self.count_anbieter -= 1
+        else:
+            self.count_nachfrager -= 1
+
+    def agent_hinzufuegen(self, agent):
+        """
+        Fügt einen Agenten dem Aktivierungsschema hinzu und zählt ihn.
+        
+        Nur Nachfrager werden dort in jedem Schritt aktiviert, die Abwanderung der
+        Anbieter wird gesammelt in pruefe_abwanderung_anbieter geprüft.
+        
+        Args:
+            agent (Anbieter | Nachfrager): Der hinzuzufügende Agent
+        """
+        self.schedule.add(agent)
+        self.register_join(agent.kind)
+
+    def agent_entfernen(self, agent):
+        """
+        Entfernt einen Agenten aus dem Aktivierungsschema und zählt ihn ab.
+        
+        Args:
+            agent (Anbieter | Nachfrager): Der zu entfernende Agent
+        """
+        self.schedule.remove(agent)
+        self.register_leave(agent.kind)
+
+    def entferne_abgewanderte_nachfrager(self):
+        """
+        Entfernt alle im aktuellen Schritt abgewanderten Nachfrager.
+        
+        Die Nachfrager werden während der Aktivierung nur vorgemerkt, damit sich die
+        Positionen in der Nachfragerliste innerhalb eines Schritts nicht verschieben.
+        Die Entfernung erfolgt absteigend nach Position, sodass beim Swap-Pop nur
+        verbleibende Nachfrager nachrücken.
+        """
+        abgewandert = sorted(self._abgewanderte_nf, key=lambda a: a._idx, reverse=True)
+        for agent in abgewandert:
+            self.agent_entfernen(agent)
+        self.abgewanderte_nachfrager += len(abgewandert)
+        self._abgewanderte_nf = []
+
+    def pruefe_abwanderung_anbieter(self):
+        """
+        Prüft für alle Anbieter gleichzeitig, ob sie die Plattform verlassen.
+        
+        Die Entscheidung basiert auf zwei Faktoren:
+        1. Die durchschnittliche Bewertung (schlechte Bewertungen erhöhen die Abwanderungswahrscheinlichkeit)
+        2. Der Zustand der Netzwerkeffekte (sinkende Netzwerkeffekte erhöhen die Abwanderungswahrscheinlichkeit)
+        
+        Beide Faktoren werden zu einer Gesamtwahrscheinlichkeit zusammengefasst und mit
+        einer Zufallszahl je Anbieter verglichen. Die Prüfung selbst läuft als Kernel über
+        die Bewertungsarrays aller Anbieter (mit Numba kompiliert, falls verfügbar).
+        """
+        n = len(self.anbieter_list)
+        if n == 0:
+            return
+        
+        bew_sum = np.fromiter((a.bew_sum for a in self.anbieter_list), dtype=np.int64, count=n)
+        bew_count = np.fromiter((a.bew_count for a in self.anbieter_list), dtype=np.int64, count=n)
+        
+        # Stärkerer Rückgang der Netzwerkeffekte führt zu höherer Abwanderungswahrscheinlichkeit
+        p_netz = self._p_anb if self._sinkt else 0.0
+        
+        abwandernd = np.flatnonzero(abwanderung_anbieter(bew_sum, bew_count, self.rng.random(n), p_netz))
+        
+        # Absteigend entfernen, damit beim Swap-Pop nur verbleibende Anbieter nachrücken
+        for i in abwandernd[::-1]:
+            self.agent_entfernen(self.anbieter_list[i])
+        self.abgewanderte_anbieter += len(abwandernd)
+
     def berechne_netzwerkeffekte(self):
         """
         Berechnet die aktuellen Netzwerkeffekte basierend auf der Anzahl der Anbieter und Nachfrager
@@ -98,17 +432,17 @@ class PlattformModel(Model):
         Returns:
             float: Durchschnittlicher Netzwerkeffekt über die letzten Zeitschritte
         """
-        anbieterzahl = sum(1 for a in self.schedule.agents if isinstance(a, Anbieter))
-        nachfragerzahl = sum(1 for a in self.schedule.agents if isinstance(a, Nachfrager))
-        cluster_effekt = sum(cluster.effekt for cluster in self.aktive_cluster)
+        anbieterzahl = self.count_anbieter
+        nachfragerzahl = self.count_nachfrager
 
         # Berechnung des momentanen Netzwerkeffekts
         # Gewichtung: 40% Anbieter, 60% Nachfrager, zusätzlich 30% der Cluster-Effekte
-        N_p = (0.4 * anbieterzahl) + (0.6 * nachfragerzahl) + (0.3 * cluster_effekt)
+        # (bereits gewichtet in _cluster_effekt_sum)
+        N_p = (0.4 * anbieterzahl) + (0.6 * nachfragerzahl) + self._cluster_effekt_sum
         self.N_p_history.append(N_p)
         
         # Rückgabe des Durchschnitts über die gespeicherten Werte
-        return sum(self.N_p_history) / len(self.N_p_history)
+        return self.N_p_history.mittelwert()
 
     def sinkt_netzwerkeffekt(self):
         """
@@ -193,13 +527,32 @@ class PlattformModel(Model):
         In jedem Schritt werden:
         1. Aktuelle Daten gespeichert
         2. Zähler zurückgesetzt
-        3. Alle Agenten aktiviert
-        4. Neue Anbieter und Nachfrager mit dynamischen Wahrscheinlichkeiten hinzugefügt
+        3. Alle Nachfrager aktiviert und abgewanderte Nachfrager entfernt
+        4. Die Abwanderung aller Anbieter geprüft
+        5. Neue Anbieter und Nachfrager mit dynamischen Wahrscheinlichkeiten hinzugefügt
         
         Die Methode steuert das Wachstum der Plattform basierend auf den aktuellen
         Netzwerkeffekten und dem Erfolg der implementierten Strategien.
         """
-        self.datacollector.collect(self)  # Speichern der aktuellen Werte, bevor die Zähler zurückgesetzt werden
+        # Speichern der aktuellen Werte, bevor die Zähler zurückgesetzt werden. Ohne Zeitreihe
+        # laufen die Reporter nur im letzten Schritt, die Netzwerkeffekt-History muss jedoch
+        # in jedem Schritt fortgeschrieben werden.
+        self._schritt += 1
+        if self.collect_timeseries or self._schritt >= self.schritte:
+            self.datacollector.collect(self)
+        else:
+            self.berechne_netzwerkeffekte()
+
+        # Der Netzwerkeffekt-Trend ist für alle Agenten eines Schritts gleich und wird daher
+        # nur einmal bestimmt (die History wurde gerade mit den Netzwerkeffekten aktualisiert)
+        self._sinkt = self.sinkt_netzwerkeffekt()
+        delta = abs(self.N_p_history[-1] - self.N_p_history[0])
+        self._p_anb = max(0.05, min(0.2, delta / 1000))
+        self._p_nf = max(0.02, min(0.15, delta / 1500))
+        
+        # Abwanderungsentscheidung aller Nachfrager mit einer Zufallszahl je Nachfrager vorab bestimmen
+        p_netz_nf = self._p_nf if self._sinkt else 0.0
+        self._abwandernd_nf = abwanderung_nachfrager(self.rng.random(len(self.nachfrager_list)), p_netz_nf)
 
         self.neue_anbieter = 0
         self.neue_nachfrager = 0
@@ -207,43 +560,42 @@ class PlattformModel(Model):
         self.abgewanderte_nachfrager = 0
 
         self.schedule.step()
+        self.entferne_abgewanderte_nachfrager()
+        self.pruefe_abwanderung_anbieter()
 
         # Dynamische Beitrittswahrscheinlichkeiten basierend auf Netzwerkeffekten
         beitrittsrate_nachfrager = self.berechne_beitrittsrate_nachfrager()
         beitrittsrate_anbieter = self.berechne_beitrittsrate_anbieter()
         
         # Aktuelle Plattformgröße für dynamischen Zuwachs
-        aktuelle_anbieter = sum(1 for a in self.schedule.agents if isinstance(a, Anbieter))
-        aktuelle_nachfrager = sum(1 for a in self.schedule.agents if isinstance(a, Nachfrager))
+        aktuelle_anbieter = self.count_anbieter
+        aktuelle_nachfrager = self.count_nachfrager
         
         # Dynamisches Wachstumspotenzial basierend auf aktueller Größe
         max_neue_anbieter = max(5, int(aktuelle_anbieter * 0.03))  # Maximum 3% der aktuellen Anzahl, mindestens 5
         max_neue_nachfrager = max(10, int(aktuelle_nachfrager * 0.01))  # Maximum 1% der aktuellen Anzahl, mindestens 10
 
-        # Neue Anbieter mit dynamischer Wahrscheinlichkeit
-        neue_anbieter_heute = 0
-        for _ in range(max_neue_anbieter):
-            if random.random() < beitrittsrate_anbieter:
-                neuer_anbieter = Anbieter(self.next_id, self)
-                self.schedule.add(neuer_anbieter)
-                self.next_id += 1
-                neue_anbieter_heute += 1
+        # Neue Anbieter mit dynamischer Wahrscheinlichkeit: die Anzahl erfolgreicher Beitritte
+        # unter max_neue_anbieter unabhängigen Kandidaten ist binomialverteilt
+        neue_anbieter_heute = int(self.rng.binomial(max_neue_anbieter, beitrittsrate_anbieter))
+        for _ in range(neue_anbieter_heute):
+            neuer_anbieter = Anbieter(self.next_id, self)
+            self.agent_hinzufuegen(neuer_anbieter)
+            self.next_id += 1
         
         self.neue_anbieter = neue_anbieter_heute
 
-        # Neue Nachfrager mit dynamischer Wahrscheinlichkeit
-        neue_nachfrager_heute = 0
-        for _ in range(max_neue_nachfrager):
-            if random.random() < beitrittsrate_nachfrager:
-                neuer_nachfrager = Nachfrager(self.next_id, self)
-                self.schedule.add(neuer_nachfrager)
-                self.next_id += 1
-                neue_nachfrager_heute += 1
+        # Neue Nachfrager mit dynamischer Wahrscheinlichkeit (ebenfalls binomialverteilt)
+        neue_nachfrager_heute = int(self.rng.binomial(max_neue_nachfrager, beitrittsrate_nachfrager))
+        for _ in range(neue_nachfrager_heute):
+            neuer_nachfrager = Nachfrager(self.next_id, self)
+            self.agent_hinzufuegen(neuer_nachfrager)
+            self.next_id += 1
                 
         self.neue_nachfrager = neue_nachfrager_heute
 
         # Debugging-Info
-        if self.schedule.steps % 30 == 0:  # Nur jeden 30. Schritt anzeigen
+        if self.verbose and self.schedule.steps % 30 == 0:  # Nur jeden 30. Schritt anzeigen
             print(f"Tag {self.schedule.steps}: Neue Anbieter: {neue_anbieter_heute}, Neue Nachfrager: {neue_nachfrager_heute}")
             print(f"Aktuelle Beitrittsraten: Anbieter {beitrittsrate_anbieter:.3f}, Nachfrager {beitrittsrate_nachfrager:.3f}")
             print(f"Aktueller Netzwerkeffekt: {self.N_p_history[-1]:.2f}")
@@ -0,0 +1,126 @@
+import os
+import pandas as pd
+
+# pyarrow ist optional: ohne pyarrow werden Rohdaten weiterhin als CSV geschrieben
+try:
+    import pyarrow  # noqa: F401
+    PARQUET_VERFUEGBAR = True
+except ImportError:
+    PARQUET_VERFUEGBAR = False
+
+# Mögliche Endungen der Rohdatendateien, bevorzugtes Format zuerst
+ROHDATEN_ENDUNGEN = (".parquet", ".csv")
+
+# Dateiname der Markierung, die eine vollständig geschriebene Iteration kennzeichnet
+ABSCHLUSS_MARKIERUNG = "abgeschlossen"
+
+def speichere_rohdaten(df, pfad_ohne_endung, index=False):
+    """
+    Speichert eine große Rohdatentabelle möglichst kompakt.
+
+    Ist pyarrow installiert, wird die Tabelle spaltenorientiert und zstd-komprimiert
+    als Parquet-Datei geschrieben, andernfalls als CSV-Datei.
+
+    Args:
+        df (pandas.DataFrame): Die zu speichernde Tabelle
+        pfad_ohne_endung (str): Zielpfad ohne Dateiendung
+        index (bool): Ob der Index mitgespeichert werden soll
+
+    Returns:
+        str: Pfad der geschriebenen Datei
+    """
+    if PARQUET_VERFUEGBAR:
+        pfad = f"{pfad_ohne_endung}.parquet"
+        df.to_parquet(pfad, engine="pyarrow", compression="zstd", index=index)
+    else:
+        pfad = f"{pfad_ohne_endung}.csv"
+        df.to_csv(pfad, index=index)
+    return pfad
+
+def lade_rohdaten(pfad, spalten=None):
+    """
+    Liest eine mit speichere_rohdaten geschriebene Tabelle ein.
+    
+    Das Format wird anhand der Dateiendung bestimmt, sodass Parquet- und CSV-Dateien
+    gleichermaßen verarbeitet werden können.
+    
+    Args:
+        pfad (str): Pfad zur Parquet- oder CSV-Datei
+        spalten (list, optional): Nur diese Spalten einlesen (Standard: alle Spalten)
+    
+    Returns:
+        pandas.DataFrame: Die eingelesene Tabelle
+    """
+    if pfad.endswith(".parquet"):
+        return pd.read_parquet(pfad, engine="pyarrow", columns=spalten)
+    return pd.read_csv(pfad, usecols=spalten)
+
+def finde_rohdaten(dateinamen, name_ohne_endung):
+    """
+    Sucht in einer Menge von Dateinamen die Rohdatendatei mit dem angegebenen Namen.
+    
+    Parquet-Dateien werden CSV-Dateien gleichen Namens vorgezogen.
+    
+    Args:
+        dateinamen (set): Vorhandene Dateinamen, z.B. eines Verzeichnisses
+        name_ohne_endung (str): Gesuchter Dateiname ohne Endung
+    
+    Returns:
+        str: Der gefundene Dateiname oder None
+    """
+    for endung in ROHDATEN_ENDUNGEN:
+        if name_ohne_endung + endung in dateinamen:
+            return name_ohne_endung + endung
+    return None
+
+def markiere_abgeschlossen(verzeichnis):
+    """
+    Legt die Abschlussmarkierung in einem vollständig geschriebenen Iterationsverzeichnis an.
+    
+    Args:
+        verzeichnis (str): Pfad zum Iterationsverzeichnis
+    
+    Returns:
+        None
+    """
+    with open(os.path.join(verzeichnis, ABSCHLUSS_MARKIERUNG), 'w', encoding='utf-8'):
+        pass
+
+def finde_iterationsverzeichnisse(basis_verzeichnis, lauf_id=None):
+    """
+    Sucht die Iterationsverzeichnisse des neuesten abgeschlossenen Simulationsdurchlaufs.
+    
+    Die Verzeichnisse heißen iteration_{Nummer}_{Lauf-ID} mit Startzeitpunkt und Prozess-ID
+    des Durchlaufs als Lauf-ID (ältere Durchläufe: iteration_{Nummer}). Berücksichtigt
+    werden nur Iterationen mit Abschlussmarkierung, damit ein noch laufender oder
+    abgebrochener Durchlauf nicht ausgewertet wird. Ohne Angabe einer Lauf-ID wird
+    der neueste Durchlauf mit abgeschlossenen Iterationen gewählt.
+    
+    Args:
+        basis_verzeichnis (str): Pfad zum Hauptverzeichnis der Simulationsläufe
+        lauf_id (str, optional): Lauf-ID des auszuwertenden Durchlaufs
+    
+    Returns:
+        list: Paare aus (Iterationsnummer, Pfad), sortiert nach Iterationsnummer
+    """
+    if not os.path.isdir(basis_verzeichnis):
+        return []
+    
+    gefunden = []
+    with os.scandir(basis_verzeichnis) as it:
+        for eintrag in it:
+            if eintrag.is_dir() and eintrag.name.startswith("iteration_"):
+                teile = eintrag.name.split('_', 2)
+                eintrag_lauf_id = teile[2] if len(teile) > 2 else ""
+                # Ältere Durchläufe ohne Lauf-ID kennen keine Abschlussmarkierung
+                abgeschlossen = eintrag_lauf_id == "" or os.path.exists(
+                    os.path.join(eintrag.path, ABSCHLUSS_MARKIERUNG))
+                if abgeschlossen:
+                    gefunden.append((eintrag_lauf_id, int(teile[1]), eintrag.path))
+    
+    if not gefunden:
+        return []
+    
+    if lauf_id is None:
+        lauf_id = max(eintrag_lauf_id for eintrag_lauf_id, _, _ in gefunden)
+    return sorted((nummer, pfad) for eintrag_lauf_id, nummer, pfad in gefunden if eintrag_lauf_id == lauf_id)
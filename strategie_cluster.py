@@ -1,26 +1,22 @@
+import numpy as np
+from dataclasses import dataclass
+
+@dataclass(frozen=True, slots=True)
 class StrategieCluster:
     """
     Repräsentiert einen Strategie-Cluster oder eine einzelne Maßnahme mit dazugehörigem Effekt.
     
     Ein StrategieCluster kann entweder eine einzelne Maßnahme darstellen oder einen 
     Zusammenschluss mehrerer Maßnahmen zu einem Cluster, bei dem Synergieeffekte 
-    berücksichtigt werden können.
+    berücksichtigt werden können. Instanzen sind unveränderlich und hashbar.
     
     Attributes:
         name (str): Name des Strategie-Clusters oder der Maßnahme
         effekt (float): Numerischer Effektwert, der den Einfluss auf die Netzwerkeffekte angibt
     """
     
-    def __init__(self, name, effekt):
-        """
-        Initialisiert einen neuen StrategieCluster.
-        
-        Args:
-            name (str): Name des Strategie-Clusters oder der Maßnahme
-            effekt (float): Numerischer Effektwert, der den Einfluss auf die Netzwerkeffekte angibt
-        """
-        self.name = name
-        self.effekt = effekt
+    name: str
+    effekt: float
 
 # Einzelne Maßnahmen Sichtbarkeit & Nutzergewinnung mit Netzwerkeffekten
 sem = StrategieCluster("SEM", 5.16)
@@ -28,8 +24,8 @@ social_media_marketing = StrategieCluster("Social-Media-Marketing", 2)
 affiliate_marketing = StrategieCluster("Affiliate-Marketing", 16)
 
 # Cluster: Sichtbarkeit & Nutzergewinnung mit Synergiebonus (10 %)
-sichtbarkeit_cluster = StrategieCluster("Sichtbarkeit & Nutzergewinnung", 
-    (sem.effekt + social_media_marketing.effekt + affiliate_marketing.effekt) * 1.1)  
+# Vorberechnet: (sem.effekt + social_media_marketing.effekt + affiliate_marketing.effekt) * 1.1
+sichtbarkeit_cluster = StrategieCluster("Sichtbarkeit & Nutzergewinnung", 25.476000000000003)
 
 
 # Einzelne Maßnahmen Monetarisierung mit Netzwerkeffekten
@@ -37,8 +33,8 @@ reduzierte_gebuehren = StrategieCluster("Reduzierte Gebühren", 4)
 freemium_modell = StrategieCluster("Freemium Modell", 25)
 
 # Cluster: Monetarisierung mit Synergiebonus (10 %)
-monetarisierung_cluster = StrategieCluster("Monetarisierung", 
-    (reduzierte_gebuehren.effekt + freemium_modell.effekt) * 1.1)  
+# Vorberechnet: (reduzierte_gebuehren.effekt + freemium_modell.effekt) * 1.1
+monetarisierung_cluster = StrategieCluster("Monetarisierung", 31.900000000000002)
 
 
 # Einzelne Maßnahmen Community & Nutzerbindung mit Netzwerkeffekten
@@ -46,8 +42,8 @@ eigenes_forum = StrategieCluster("Eigenes Forum", 2)
 treuepunkte = StrategieCluster("Treuepunkte", 20)
 
 # Cluster: Community & Nutzerbindung mit Synergiebonus (10 %)
-community_cluster = StrategieCluster("Community & Nutzerbindung", 
-    (eigenes_forum.effekt + treuepunkte.effekt) * 1.1)  
+# Vorberechnet: (eigenes_forum.effekt + treuepunkte.effekt) * 1.1
+community_cluster = StrategieCluster("Community & Nutzerbindung", 24.200000000000003)
 
 
 # Einzelne Maßnahmen Nachhaltigkeit & Lokalität mit Netzwerkeffekten
@@ -58,21 +54,32 @@ nachhaltige_produktfilter = StrategieCluster("Nachhaltige Produktfilter", 5)
 regionale_kooperationen = StrategieCluster("Regionale Kooperationen", 10)
 
 # Cluster: Nachhaltigkeit & Lokalität mit Synergiebonus (10 %)
-nachhaltigkeit_cluster = StrategieCluster("Nachhaltigkeit & Lokalität", 
-    (nachhaltige_werte.effekt + co2_transparenz.effekt + 
-     nachhaltige_produktfilter.effekt + regionale_kooperationen.effekt) * 1.1)
-
-# Debug-Ausgabe der Cluster-Effekte
-print("\nKonfigurierte Strategie-Cluster und deren Effekte:")
-print(f"Sichtbarkeit & Nutzergewinnung: {sichtbarkeit_cluster.effekt:.2f}")
-print(f"Monetarisierung: {monetarisierung_cluster.effekt:.2f}")
-print(f"Community & Nutzerbindung: {community_cluster.effekt:.2f}")
-print(f"Nachhaltigkeit & Lokalität: {nachhaltigkeit_cluster.effekt:.2f}")
+# Vorberechnet: (personalisierte_empfehlungen.effekt + nachhaltige_werte.effekt + co2_transparenz.effekt +
+#                nachhaltige_produktfilter.effekt + regionale_kooperationen.effekt) * 1.1
+nachhaltigkeit_cluster = StrategieCluster("Nachhaltigkeit & Lokalität", 52.25000000000001)
 
-# Liste aller Cluster zur einfachen Referenz
-alle_cluster = [
+# Alle Cluster zur einfachen Referenz (unveränderlich)
+alle_cluster = (
     sichtbarkeit_cluster,
     monetarisierung_cluster,
     community_cluster,
     nachhaltigkeit_cluster
-]
\ No newline at end of file
+)
+
+# Namen und Effekte aller Cluster als parallele Felder (gleiche Reihenfolge wie alle_cluster),
+# damit Summen über Cluster-Kombinationen per Indexzugriff auf ein Array berechnet werden.
+# Die Effekte liegen als zusammenhängendes float64-Array vor: Funktionen, die über Cluster-Effekte
+# aggregieren oder gewichten, sollten dieses Array statt der StrategieCluster-Objekte erhalten,
+# damit ihre Schleifen mit Numba (@njit) kompiliert werden können.
+# Das Array ist schreibgeschützt, da es von allen Importeuren gemeinsam genutzt wird.
+CLUSTER_NAMES = tuple(c.name for c in alle_cluster)
+ALLE_EFFEKTE = np.fromiter((c.effekt for c in alle_cluster), dtype=np.float64, count=len(alle_cluster))
+ALLE_EFFEKTE.setflags(write=False)
+
+# Debug-Ausgabe der Cluster-Effekte (nur beim direkten Ausführen, nicht beim Import)
+if __name__ == "__main__":
+    print("\nKonfigurierte Strategie-Cluster und deren Effekte:")
+    print(f"Sichtbarkeit & Nutzergewinnung: {sichtbarkeit_cluster.effekt:.2f}")
+    print(f"Monetarisierung: {monetarisierung_cluster.effekt:.2f}")
+    print(f"Community & Nutzerbindung: {community_cluster.effekt:.2f}")
+    print(f"Nachhaltigkeit & Lokalität: {nachhaltigkeit_cluster.effekt:.2f}")
@@ -0,0 +1,31 @@
+import math
+
+from strategie_cluster import (
+    sem, social_media_marketing, affiliate_marketing,
+    reduzierte_gebuehren, freemium_modell,
+    eigenes_forum, treuepunkte,
+    personalisierte_empfehlungen, nachhaltige_werte, co2_transparenz,
+    nachhaltige_produktfilter, regionale_kooperationen,
+    sichtbarkeit_cluster, monetarisierung_cluster, community_cluster, nachhaltigkeit_cluster,
+)
+
+# Synergiefaktor, mit dem die Effekte der Einzelmaßnahmen eines Clusters verstärkt werden
+SYNERGIE = 1.1
+
+def pruefe_cluster(cluster, massnahmen):
+    assert math.isclose(cluster.effekt, SYNERGIE * sum(m.effekt for m in massnahmen))
+
+def test_sichtbarkeit_cluster():
+    pruefe_cluster(sichtbarkeit_cluster, (sem, social_media_marketing, affiliate_marketing))
+
+def test_monetarisierung_cluster():
+    pruefe_cluster(monetarisierung_cluster, (reduzierte_gebuehren, freemium_modell))
+
+def test_community_cluster():
+    pruefe_cluster(community_cluster, (eigenes_forum, treuepunkte))
+
+def test_nachhaltigkeit_cluster():
+    pruefe_cluster(nachhaltigkeit_cluster, (
+        personalisierte_empfehlungen, nachhaltige_werte, co2_transparenz,
+        nachhaltige_produktfilter, regionale_kooperationen,
+    ))